@@ -12,14 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from authorship_unmasking.util.util import get_base_path
+from authorship_unmasking.util.util import get_base_path, lru_cache
 
 from abc import abstractmethod, ABCMeta
 import os
+from types import MappingProxyType
 from typing import Any, Dict, Union
 
 
 class ConfigLoader(metaclass=ABCMeta):
+
     @abstractmethod
     def load(self, cfg: Union[str, Dict[str, Any]]):
         """
@@ -90,24 +92,35 @@ class ConfigLoader(metaclass=ABCMeta):
         it will be resolved relatively as well. If after the last try the file could
         still not be found, a :class:: FileNotFoundError will be raised.
 
+        Resolved paths are cached in an LRU cache (see :func:: clear_lru_caches()).
+
         :return: resolved path
         """
-        if os.path.isabs(path) and os.path.isfile(path):
-            return path
+        return _resolve_relative_path(path, self.get_config_path())
 
-        rc_file = os.path.join(self.get_config_path(), path)
-        if os.path.exists(rc_file):
-            return os.path.realpath(rc_file)
 
-        rc_file = os.path.join(get_base_path(), path)
-        if os.path.exists(rc_file):
-            return rc_file
+@lru_cache(maxsize=256)
+def _resolve_relative_path(path: str, config_path: str) -> str:
+    """
+    Memoized implementation of :meth:: ConfigLoader.resolve_relative_path().
 
-        rc_file = os.path.join(get_base_path(), "etc", path)
-        if not os.path.exists(rc_file):
-            raise FileNotFoundError("No such file or directory: {}".format(path))
+    :param path: path to resolve
+    :param config_path: config directory
+    :return: resolved path
+    """
+    if os.path.isabs(path) and os.path.isfile(path):
+        return path
+
+    app_path = get_base_path()
+    app_etc_path = os.path.join(app_path, "etc")
 
-        return os.path.realpath(rc_file)
+    # (directory, whether to resolve symlinks in the found path)
+    for search_path, resolve in ((config_path, True), (app_path, False), (app_etc_path, True)):
+        rc_file = os.path.join(search_path, path)
+        if os.path.exists(rc_file):
+            return os.path.realpath(rc_file) if resolve else rc_file
+
+    raise FileNotFoundError("No such file or directory: {}".format(path))
 
 
 # noinspection PyPep8Naming
@@ -142,12 +155,6 @@ class instance_property(property):
         super().__init__(fget, fset, fdel, doc)
         return self
 
-    def __get__(self, obj, objtype=None):
-        obj = super().__get__(obj, objtype)
-        if objtype is not None:
-            objtype.delegate_args = self.delegate_args
-        return obj
-
     def getter(self, fget):
         return type(self)(fget, self.fset, self.fdel, self.__doc__, self.delegate_args)
 
@@ -167,11 +174,64 @@ class instance_list_property(instance_property):
     pass
 
 
+# property kinds as stored in Configurable._property_kinds
+_PROPERTY = 0
+_PATH_PROPERTY = 1
+_INSTANCE_PROPERTY = 2
+_INSTANCE_LIST_PROPERTY = 3
+
+
 class Configurable:
     """
     Base class for classes which are configurable at runtime via @properties.
+
+    Every assignment to a property increments the instance's configuration version,
+    which can be used as part of cache keys for results that depend on the configuration.
     """
 
+    _config_version = 0
+
+    # mapping of property names to property kinds, built once per class
+    _property_kinds = MappingProxyType({})
+
+    # names of instance properties which delegate constructor arguments, built once per class
+    _delegating_properties = frozenset()
+
+    # names of path properties, built once per class
+    _path_properties = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        kinds = {}
+        delegating = set()
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                delegating.discard(name)
+                if isinstance(attr, instance_property) and attr.delegate_args:
+                    delegating.add(name)
+
+                if isinstance(attr, instance_list_property):
+                    kinds[name] = _INSTANCE_LIST_PROPERTY
+                elif isinstance(attr, instance_property):
+                    kinds[name] = _INSTANCE_PROPERTY
+                elif isinstance(attr, path_property):
+                    kinds[name] = _PATH_PROPERTY
+                elif isinstance(attr, property):
+                    kinds[name] = _PROPERTY
+                elif name in kinds:
+                    # property shadowed by a plain attribute in a sub class
+                    del kinds[name]
+
+        cls._property_kinds = MappingProxyType(kinds)
+        cls._delegating_properties = frozenset(delegating)
+        cls._path_properties = frozenset(n for n, k in kinds.items() if k == _PATH_PROPERTY)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self._property_kinds:
+            super().__setattr__("_config_version", self._config_version + 1)
+
     def set_property(self, name: str, value: Any):
         """
         Dynamically set a given configuration property.
@@ -180,7 +240,7 @@ class Configurable:
         :param value: property value
         :raise: KeyError if property does not exist
         """
-        if not self.has_property(name):
+        if name not in self._property_kinds:
             raise KeyError("{}@{}: No such configuration property".format(self.__class__.__name__, name))
 
         setattr(self, name, value)
@@ -192,7 +252,7 @@ class Configurable:
         :param name: property name
         :return: whether object has a given property
         """
-        return hasattr(self.__class__, name) and isinstance(getattr(self.__class__, name), property)
+        return name in self._property_kinds
 
     def is_path_property(self, name: str) -> bool:
         """
@@ -204,7 +264,7 @@ class Configurable:
         :param name: property name
         :return: whether property is a path property
         """
-        return isinstance(getattr(self.__class__, name), path_property)
+        return name in self._path_properties
 
     def is_instance_property(self, name: str) -> bool:
         """
@@ -215,7 +275,7 @@ class Configurable:
         :param name: property name
         :return: whether property is a recursive instance property
         """
-        return isinstance(getattr(self.__class__, name), instance_property)
+        return self._property_kinds.get(name, _PROPERTY) >= _INSTANCE_PROPERTY
 
     def is_instance_list_property(self, name: str) -> bool:
         """
@@ -226,4 +286,14 @@ class Configurable:
         :param name: property name
         :return: whether property is a recursive instance list property
         """
-        return isinstance(getattr(self.__class__, name), instance_list_property)
+        return self._property_kinds.get(name) == _INSTANCE_LIST_PROPERTY
+
+    def delegates_args(self, name: str) -> bool:
+        """
+        Check whether an instance property delegates the constructor arguments
+        of its parent to the instances it is configured with.
+
+        :param name: property name
+        :return: whether property delegates constructor arguments
+        """
+        return name in self._delegating_properties
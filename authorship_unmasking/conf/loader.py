@@ -19,6 +19,9 @@ from typing import Any, Dict, Union
 import os
 import yaml
 
+# use the libyaml-based loader if PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class YamlLoader(ConfigLoader):
     """
@@ -57,7 +60,8 @@ class YamlLoader(ConfigLoader):
     def load(self, cfg: Union[str, Dict[str, Any]]):
         if type(cfg) is str:
             self._config_dir = os.path.realpath(os.path.dirname(cfg))
-            cfg = yaml.safe_load(open(cfg, 'r'))
+            with open(cfg, 'r') as f:
+                cfg = yaml.load(f, Loader=SafeLoader)
 
         if type(cfg) is not dict:
             raise RuntimeError("Invalid configuration")
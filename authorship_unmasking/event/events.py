@@ -23,6 +23,8 @@ class ProgressEvent(Event):
     """
     Event for indicating progress of an operation with a fixed number of steps to be performed.
     """
+
+    __slots__ = ("_events_total",)
     
     def __init__(self, group_id: str, serial: int, events_total: Optional[int] = None):
         """
@@ -77,25 +79,28 @@ class ProgressEvent(Event):
 class PairChunkingProgressEvent(ProgressEvent):
     """
     Event for indicating pair chunking progress.
+    Serial numbers and totals count texts, usually of all pairs generated in one pass over a corpus.
     """
 
+    __slots__ = ()
+
     @property
     def text(self) -> str:
         """Get user-readable textural representation of this event."""
         if self.percent_done is not None:
-            return "Chunking pair: ({:.2f}%)".format(self.percent_done)
+            return "Chunking pairs: {}/{} texts ({:.2f}%)".format(self.serial, self.events_total, self.percent_done)
 
-        return "Chunking pair..."
+        return "Chunking pairs: {} texts".format(self.serial)
 
     @property
     def generic_text(self) -> Optional[str]:
         """Generic progress description."""
-        return "Chunking pair"
+        return "Chunking pairs"
 
     @property
     def unit(self) -> Optional[str]:
         """Progress item unit name."""
-        return "pair(s)"
+        return "text(s)"
 
 
 class CrossvalProgressEvent(ProgressEvent):
@@ -103,6 +108,8 @@ class CrossvalProgressEvent(ProgressEvent):
     Event for status reports on cross-validation progress.
     """
 
+    __slots__ = ()
+
     def __init__(self, group_id: str, serial: int, total: Optional[int] = None):
         """
         :param group_id: event group ID token
@@ -126,6 +133,8 @@ class PairBuildingProgressEvent(ProgressEvent):
     Event for status reports on pair generation.
     """
 
+    __slots__ = ("_pair", "_files_a", "_files_b")
+
     def __init__(self, group_id: str, serial: int, pairs_total: Optional[int] = None, pair: SamplePair = None,
                  files_a: Optional[List[str]] = None, files_b: Optional[List[str]] = None):
         """
@@ -217,6 +226,8 @@ class UnmaskingTrainCurveEvent(Event):
     """
     Event for updating training curves of pairs during unmasking.
     """
+
+    __slots__ = ("_n", "_values", "_pair", "_feature_set")
     
     def __init__(self, group_id: str, serial: int, n: int = 0, pair: SamplePair = None, feature_set: type = None):
         """
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
+import copy
 from uuid import UUID, uuid5
 from typing import Iterable
 
@@ -26,6 +27,8 @@ class Event:
     :class:: `EventHandler`s can subscribe to individual events.
     """
 
+    __slots__ = ("_group_id", "_serial")
+
     EVENT_NS = UUID("fec851d1-2876-5072-b07b-cb289dd5dbef")
 
     def __init__(self, group_id: str, serial: int):
@@ -57,12 +60,9 @@ class Event:
 
     def clone(self) -> "Event":
         """
-        Return a new cloned instance of this event.
-        Sub classes should override this method if they change the constructor signature.
+        Return a new cloned (shallow) instance of this event.
         """
-        event = self.__class__(self.group_id, self.serial)
-        event.__dict__ = self.__dict__.copy()
-        return event
+        return copy.copy(self)
 
     @property
     def group_id(self) -> str:
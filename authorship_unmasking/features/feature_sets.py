@@ -16,14 +16,12 @@ from authorship_unmasking.conf.interfaces import instance_property, instance_lis
 from authorship_unmasking.features.interfaces import ChunkSampler, FeatureSet
 from authorship_unmasking.input.interfaces import SamplePair, Tokenizer
 from authorship_unmasking.input.tokenizers import WordTokenizer, CharNgramTokenizer, DisjunctCharNgramTokenizer
-from authorship_unmasking.util.util import lru_cache
 
 from copy import deepcopy
 import numpy
 from math import ceil
-from nltk import FreqDist
 
-from typing import List, Iterable
+from typing import List, Iterable, Tuple
 
 
 class MetaFeatureSet(FeatureSet):
@@ -113,8 +111,8 @@ class MultiChunkFeatureSet(MetaFeatureSet):
 class CachedAvgTokenCountFeatureSet(FeatureSet):
     """
     Generic feature set which uses the average frequency counts per chunk of the
-    tokens generated by a specified tokenizer and caches them in memory.
-    By default, the cache size is limited to 2000 chunks.
+    tokens generated by a specified tokenizer. Chunks are tokenized only once
+    into arrays of token IDs, which are kept in memory while features are generated.
     """
     def __init__(self, pair: SamplePair = None, sampler: ChunkSampler = None, chunk_tokenizer: Tokenizer = None):
         """
@@ -127,8 +125,10 @@ class CachedAvgTokenCountFeatureSet(FeatureSet):
         self._chunk_tokenizer = chunk_tokenizer
         self._is_prepared = False
 
-        self.__freq_a = None
-        self.__freq_b = None
+        self._vocabulary = {}
+        self._chunk_ids = {}
+        self._avg_freqs = None
+        self._tie_order = None
         self._chunks  = []
 
     @instance_property
@@ -149,71 +149,82 @@ class CachedAvgTokenCountFeatureSet(FeatureSet):
         if self._is_prepared:
             return
 
-        freq_dist_a = FreqDist()
-        for a in self._pair.chunks_a:
-            freq_dist_a.update(self._tokenize(a))
+        # tokenize every chunk only once into an array of token IDs
+        self._vocabulary = {}
+        self._chunk_ids = {}
+        ids_a = [self._get_chunk_ids(a) for a in self._pair.chunks_a]
+        ids_b = [self._get_chunk_ids(b) for b in self._pair.chunks_b]
+
+        num_tokens = len(self._vocabulary)
+        freq_a = numpy.bincount(numpy.concatenate(ids_a or [[]]).astype(numpy.int32), minlength=num_tokens)
+        freq_b = numpy.bincount(numpy.concatenate(ids_b or [[]]).astype(numpy.int32), minlength=num_tokens)
+        self._avg_freqs = (freq_a / freq_a.sum() + freq_b / freq_b.sum()) / 2.0
+
+        # Order in which tokens with the same average frequency are ranked: tokens of the first
+        # chunk set by descending frequency, then the remaining ones of the second chunk set by
+        # descending frequency (ties broken by first occurrence). This is the order in which
+        # frequency distributions of both chunk sets used to be merged.
+        in_a = freq_a > 0
+        self._tie_order = numpy.lexsort((numpy.arange(num_tokens),
+                                         -numpy.where(in_a, freq_a, freq_b),
+                                         ~in_a))
 
-        freq_dist_b = FreqDist()
-        for b in self._pair.chunks_b:
-            freq_dist_b.update(self._tokenize(b))
+        self._chunks = self._sampler.generate_chunk_pairs(self._pair)
 
-        self._avg_freq_dist = FreqDist()
-        n_a = freq_dist_a.N()
-        n_b = freq_dist_b.N()
-        for a in freq_dist_a:
-            self._avg_freq_dist[a] = (freq_dist_a[a] / n_a + freq_dist_b[a] / n_b) / 2.0
-        for b in freq_dist_b:
-            if self._avg_freq_dist[b] != 0.0:
-                continue
-            self._avg_freq_dist[b] = (freq_dist_a[b] / n_a + freq_dist_b[b] / n_b) / 2.0
+        self._is_prepared = True
 
-        self._chunks = self._sampler.generate_chunk_pairs(self._pair)
+    def _get_chunk_ids(self, chunk) -> numpy.ndarray:
+        """
+        Get token IDs of a chunk, tokenizing it if it hasn't been tokenized before.
 
-        self.__freq_a = None
-        self.__freq_b = None
+        :param chunk: input chunk
+        :return: array of token IDs
+        """
+        ids = self._chunk_ids.get(chunk)
+        if ids is None:
+            ids = self._chunk_tokenizer.tokenize_ids(chunk, self._vocabulary)
+            self._chunk_ids[chunk] = ids
+        return ids
 
-        self._is_prepared = True
+    def _get_token_counts(self, n: int) -> Iterable[Tuple[numpy.ndarray, int, int]]:
+        """
+        Generate absolute count vectors of the n most frequent tokens for all sampled chunk pairs.
 
-    def get_features_absolute(self, n: int) -> Iterable[numpy.ndarray]:
+        :param n: number of tokens
+        :return: generator of count vectors and the total numbers of tokens of both chunks
+        """
         self._prepare()
 
-        top_n_words = numpy.array([w for (w, f) in self._avg_freq_dist.most_common(n)])
-        num_top_words = len(top_n_words)
+        tie_order = self._tie_order
+        top_n_ids = tie_order[numpy.argsort(-self._avg_freqs[tie_order], kind="stable")[:n]]
+
+        # map token IDs to their feature vector positions (-1 for tokens not in the top n)
+        positions = numpy.full(len(self._avg_freqs), -1, dtype=numpy.int64)
+        positions[top_n_ids] = numpy.arange(len(top_n_ids))
+
         for c in self._chunks:
             vec = numpy.zeros(2 * n)
 
-            self.__freq_a = FreqDist(self._tokenize(c[0]))
+            ids_a = self._chunk_ids[c[0]]
+            pos = positions[ids_a]
+            vec[0:n] = numpy.bincount(pos[pos >= 0], minlength=n)
 
-            for i in range(0, n):
-                if i >= num_top_words:
-                    break
-                vec[i] = self.__freq_a[top_n_words[i]]
+            ids_b = self._chunk_ids[c[1]]
+            pos = positions[ids_b]
+            vec[n:2 * n] = numpy.bincount(pos[pos >= 0], minlength=n)
 
-            self.__freq_b = FreqDist(self._tokenize(c[1]))
-
-            for i in range(n, 2 * n):
-                if i >= num_top_words + n:
-                    break
-                vec[i] = self.__freq_b[top_n_words[i - n]]
+            yield vec, len(ids_a), len(ids_b)
 
+    def get_features_absolute(self, n: int) -> Iterable[numpy.ndarray]:
+        for vec, _, _ in self._get_token_counts(n):
             yield vec
 
     def get_features_relative(self, n: int) -> Iterable[numpy.ndarray]:
-        features = self.get_features_absolute(n)
-        for vec in features:
-            n_a = self.__freq_a.N()
-            for i in range(0, n):
-                vec[i] /= n_a
-            n_b = self.__freq_b.N()
-            for i in range(n, 2 * n):
-                vec[i] /= n_b
-        
+        for vec, n_a, n_b in self._get_token_counts(n):
+            vec[0:n] /= n_a
+            vec[n:2 * n] /= n_b
             yield vec
 
-    @lru_cache(maxsize=200)
-    def _tokenize(self, text) -> List[str]:
-        return list(self._chunk_tokenizer.tokenize(text))
-
 
 class AvgWordFreqFeatureSet(CachedAvgTokenCountFeatureSet):
     """
@@ -20,7 +20,7 @@ import nltk
 
 from functools import lru_cache
 from random import randint
-from typing import Any, Iterable, List
+from typing import Any, Iterable, List, Sequence, Tuple
 
 
 class SentenceChunker(Chunker):
@@ -29,8 +29,8 @@ class SentenceChunker(Chunker):
     If ``chunk_size`` is smaller than the text length, only a single chunk will be produced.
     Chunks will always contain full sentences according to the NLTK Punkt tokenizer for the given ``language``.
 
-    Chunked texts can be cached in memory for faster repeated processing. By default,
-    the cache size is limited to 400 texts.
+    Chunked texts are cached in memory for faster repeated processing. By default,
+    the cache size is limited to 500 texts.
     """
 
     def __init__(self, chunk_size: int = 500, language: str = "english"):
@@ -52,11 +52,8 @@ class SentenceChunker(Chunker):
         """Set language"""
         self._language = language
 
-    @lru_cache(maxsize=500)
     def chunk(self, text: str) -> Iterable[Any]:
-        word_tokens = self._word_tokenizer.tokenize(text)
-        assert type(word_tokens) is list
-        # noinspection PyTypeChecker
+        word_tokens = self._word_tokenizer._cached_tokenize(text)
         total_words = len(word_tokens)
         num_chunks = total_words // self._chunk_size
         ideal_chunk_size = max(total_words // max(num_chunks, 1), self._chunk_size)
@@ -68,8 +65,7 @@ class SentenceChunker(Chunker):
         current_chunk = ""
         current_chunk_size = 0
         for s in sentences:
-            # noinspection PyTypeChecker
-            num_words = len(self._word_tokenizer.tokenize(s))
+            num_words = len(self._word_tokenizer._cached_tokenize(s))
             current_chunk_size += num_words
 
             if current_chunk_size >= ideal_chunk_size:
@@ -90,8 +86,7 @@ class SentenceChunker(Chunker):
 
             # combine last two chunks if the last chunk is too small
             if len(chunks) >= 2:
-                # noinspection PyTypeChecker
-                last_chunk_len = len(self._word_tokenizer.tokenize(chunks[-1]))
+                last_chunk_len = len(self._word_tokenizer._cached_tokenize(chunks[-1]))
                 if last_chunk_len < self._chunk_size:
                     chunks[-2] += " " + chunks[-1]
                     del chunks[-1]
@@ -117,6 +112,8 @@ class RandomTokenChunker(Chunker):
     once all words have been drawn from the pool.
     """
 
+    deterministic = False
+
     def __init__(self, chunk_size: int = 600, num_chunks: int = 25, tokenizer: Tokenizer = None,
                  with_replacement: bool = True, delimiter: str = " "):
         """
@@ -135,9 +132,19 @@ class RandomTokenChunker(Chunker):
         self._delimiter = delimiter
 
     def chunk(self, text: str) -> Iterable[Any]:
-        tokens = self._tokenizer.tokenize(text)
-        if type(tokens) is not list:
-            tokens = list(tokens)
+        return self._draw_chunks(self._tokenizer._cached_tokenize(text))
+
+    def chunk_batch(self, texts: Sequence[str]) -> List[Tuple[Any, ...]]:
+        # tokenize the whole batch in one call, so the tokenizer can make use of batch processing
+        return [tuple(self._draw_chunks(tokens)) for tokens in self._tokenizer.tokenize_batch(texts)]
+
+    def _draw_chunks(self, tokens: Sequence[str]) -> Iterable[str]:
+        """
+        Generate chunks by drawing from a list of tokens.
+
+        :param tokens: tokens of the input text
+        :return: generator of chunks
+        """
         word_freq = nltk.FreqDist(tokens)
         num_words = len(tokens)
         drawn = {}
@@ -242,20 +249,24 @@ class MultiChunker(Chunker):
     """
     Chunker which generates multiple chunks from different sub chunkers.
     """
+
+    # sub chunkers cache their own results if they are deterministic
+    deterministic = False
+
     def __init__(self):
         super().__init__()
         self._sub_chunkers = []
 
     def chunk(self, text: str) -> Iterable[Any]:
         """
-        Return an iterator over chunks, where each chunk is a list of individual
+        Return an iterator over chunks, where each chunk is a tuple of individual
         corresponding chunks generated by all sub chunkers. If the sub chunkers
         return different numbers of chunks, the shorter ones will be padded with None.
 
         :param text: input text
         :return: iterator over chunk lists
         """
-        chunker_generators = [iter(c.chunk(text)) for c in self._sub_chunkers]
+        chunker_generators = [iter(c._cached_chunk(text)) for c in self._sub_chunkers]
 
         while True:
             chunks = []
@@ -267,7 +278,7 @@ class MultiChunker(Chunker):
                 except StopIteration:
                     chunks.append(None)
             if non_null:
-                yield chunks
+                yield tuple(chunks)
             else:
                 break
 
@@ -16,20 +16,122 @@ from authorship_unmasking.event.dispatch import EventBroadcaster
 from authorship_unmasking.event.events import PairBuildingProgressEvent, PairChunkingProgressEvent
 from authorship_unmasking.input.interfaces import Chunker, SamplePair, SamplePairClass, Tokenizer
 from authorship_unmasking.input.interfaces import CorpusParser
+from authorship_unmasking.util.util import get_cpu_count
 
+import asyncio
 import json
 import math
 import hashlib
 import os
+import pickle
 import random
-import re
+import tempfile
+import time
+import weakref
 import xml.etree.ElementTree as etree
-from glob import glob
-from itertools import combinations, combinations_with_replacement
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+from concurrent.futures import Executor
+from itertools import chain, combinations, combinations_with_replacement
+from typing import Any, AsyncGenerator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
-from uuid import uuid5
 from tqdm import tqdm
+import numpy as np
+
+
+class ChunkArray(Sequence):
+    """
+    Compact read-only sequence of text chunks.
+
+    All chunks are stored as one string plus an array of ``(start, end)`` offsets into it instead
+    of one string object per chunk. Individual chunks are materialized only when accessed.
+    The offset array is read-only, so chunk arrays can safely be shared (e.g. between forked processes).
+    """
+
+    __slots__ = ("_text", "_offsets")
+
+    def __init__(self, chunks: Iterable[str]):
+        """
+        :param chunks: text chunks
+        """
+        if not isinstance(chunks, (list, tuple)):
+            chunks = list(chunks)
+        self._text = "".join(chunks)
+
+        # compute offsets in place in a preallocated array
+        self._offsets = np.empty((len(chunks), 2), dtype=np.int64)
+        ends = self._offsets[:, 1]
+        np.cumsum(np.fromiter(map(len, chunks), dtype=np.int64, count=len(chunks)), out=ends)
+        self._offsets[:1, 0] = 0
+        self._offsets[1:, 0] = ends[:-1]
+        self._offsets.flags.writeable = False
+
+    @classmethod
+    def from_offsets(cls, text: str, offsets: np.ndarray) -> "ChunkArray":
+        """
+        Create a :class:: ChunkArray of chunks which are slices of an existing string.
+        Chunks may overlap or skip parts of ``text``.
+
+        :param text: string to slice chunks from
+        :param offsets: array of shape (n, 2) with ``(start, end)`` offsets of the n chunks
+        :return: chunk sequence
+        """
+        offsets = np.array(offsets, dtype=np.int64)
+        if offsets.ndim != 2 or offsets.shape[1] != 2:
+            raise ValueError("Chunk offsets must be of shape (n, 2)")
+        offsets.flags.writeable = False
+
+        obj = cls.__new__(cls)
+        obj._text = text
+        obj._offsets = offsets
+        return obj
+
+    @classmethod
+    def from_chunks(cls, chunks: Sequence[Any]) -> Sequence[Any]:
+        """
+        Create a :class:: ChunkArray from the given chunks if all of them are strings.
+        Other chunks (e.g. sub chunk tuples of a :class:: MultiChunker) are returned
+        unchanged as a tuple.
+
+        :param chunks: chunks
+        :return: compact chunk sequence or tuple of chunks
+        """
+        if isinstance(chunks, cls):
+            return chunks
+        if all(type(c) is str for c in chunks):
+            return cls(chunks)
+        return tuple(chunks)
+
+    def __reduce__(self):
+        return self.from_offsets, (self._text, self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._offsets)))]
+
+        start, end = self._offsets[index].tolist()
+        return self._text[start:end]
+
+    def __iter__(self):
+        text = self._text
+        for start, end in self._offsets.tolist():
+            yield text[start:end]
+
+
+def _chunk_batch(chunker: Chunker, texts: Sequence[str], seed: int) -> List[Tuple[Any, ...]]:
+    """
+    Chunk a batch of texts, usually in a worker process.
+    The random number generator is seeded first, so that batches chunked by workers forked
+    from the same parent process don't all draw the same random numbers.
+
+    :param chunker: chunker to use
+    :param texts: input texts
+    :param seed: random seed
+    :return: list of chunk tuples, one for each text in ``texts``
+    """
+    random.seed(seed)
+    return chunker.chunk_batch(texts)
 
 
 class SamplePairImpl(SamplePair):
@@ -42,46 +144,130 @@ class SamplePairImpl(SamplePair):
                             fired during chunk generation to indicate progress
     """
 
-    def __init__(self, cls: SamplePairClass, chunker: Chunker):
+    __slots__ = ("_pair_key", "_pair_id", "_chunks_a", "_chunks_b", "_progress_event", "_progress_offset", "_a", "_b")
+
+    # minimum number of seconds between two chunking progress events
+    PROGRESS_INTERVAL = 0.1
+
+    # time at which the last chunking progress event was published by any pair
+    _last_progress_time = 0.0
+
+    def __init__(self, cls: SamplePairClass, chunker: Chunker, pair_key: Optional[str] = None):
+        """
+        :param cls: class of the pair
+        :param chunker: chunker for splitting input text
+        :param pair_key: key string identifying the texts of this pair (e.g. built from their
+                         file names with :meth:: make_pair_key()). If not given, the pair ID
+                         will be derived from digests of the texts themselves.
+        """
         super().__init__(cls, chunker)
 
+        self._pair_key = pair_key
         self._pair_id = None
         self._chunks_a = []
         self._chunks_b = []
         self._progress_event = None
+        self._progress_offset = 0
         self._a = None
         self._b = None
 
-    async def chunk(self, a: List[str], b: List[str]):
+    async def chunk(self, a: List[str], b: List[str], executor: Optional[Executor] = None,
+                    progress_event: Optional[PairChunkingProgressEvent] = None):
         self._a = a
         self._b = b
 
-        group_id = PairChunkingProgressEvent.generate_group_id([self.pair_id])
-        total_events = len(a) + len(b)
-        self._progress_event = PairChunkingProgressEvent(group_id, 0, total_events)
+        texts = a + b
+        if progress_event is None:
+            group_id = PairChunkingProgressEvent.generate_group_id([self.pair_id])
+            self._progress_event = PairChunkingProgressEvent(group_id, 0, max(1, len(texts)))
+        else:
+            self._progress_event = progress_event
+        self._progress_offset = self._progress_event.serial
+        if self._progress_offset == 0:
+            await self._publish_progress(0, True)
+
+        # chunk texts in batches of about 5% of the pair and throttle progress events
+        batch_size = max(1, len(texts) // 20)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        chunks = []
+        if executor is None:
+            for batch in batches:
+                chunks.extend(self._chunker.chunk_batch(batch))
+                await self._publish_progress(len(chunks))
+        else:
+            # chunk all batches in parallel, each with its own seed for randomized chunkers
+            loop = asyncio.get_event_loop()
+            futures = [loop.run_in_executor(executor, _chunk_batch, self._chunker, batch, random.getrandbits(32))
+                       for batch in batches]
+            texts_done = 0
+            for f in asyncio.as_completed(futures):
+                texts_done += len(await f)
+                await self._publish_progress(texts_done)
+            for f in futures:
+                chunks.extend(f.result())
+
+        # keep the final state of the group even if it was not published, so the next pair can continue it
+        if self._progress_event.serial != self._progress_offset + len(texts):
+            self._progress_event = PairChunkingProgressEvent(self._progress_event.group_id,
+                                                             self._progress_offset + len(texts),
+                                                             self._progress_event.events_total)
+
+        self._chunks_a = ChunkArray.from_chunks(list(chain.from_iterable(chunks[:len(a)])))
+        self._chunks_b = ChunkArray.from_chunks(list(chain.from_iterable(chunks[len(a):])))
+
+    async def _publish_progress(self, texts_done: int, force: bool = False):
+        """
+        Publish a chunking progress event, but at most once every :attr:: PROGRESS_INTERVAL seconds
+        across all pairs. The event finishing a progress event group is always published.
 
-        await EventBroadcaster().publish("onChunkingProgress", self._progress_event, self.__class__.__bases__[0])
+        :param texts_done: number of texts of this pair chunked so far
+        :param force: publish regardless of when the last event was published
+        """
+        serial = self._progress_offset + texts_done
+        total = self._progress_event.events_total
+        now = time.monotonic()
+        if not force and (total is None or serial < total) \
+                and now - SamplePairImpl._last_progress_time < self.PROGRESS_INTERVAL:
+            return
 
-        for text in a:
-            async for tokens in self._chunker.await_chunks(text):
-                self._chunks_a.append(tokens)
-            self._progress_event = PairChunkingProgressEvent.new_event(self._progress_event)
-            await EventBroadcaster().publish("onChunkingProgress", self._progress_event, self.__class__.__bases__[0])
+        SamplePairImpl._last_progress_time = now
+        self._progress_event = PairChunkingProgressEvent(self._progress_event.group_id, serial, total)
+        await EventBroadcaster().publish("onChunkingProgress", self._progress_event, SamplePair)
 
-        for text in b:
-            async for tokens in self._chunker.await_chunks(text):
-                self._chunks_b.append(tokens)
-            self._progress_event = PairChunkingProgressEvent.new_event(self._progress_event)
-            await EventBroadcaster().publish("onChunkingProgress", self._progress_event, self.__class__.__bases__[0])
+    @property
+    def progress_event(self) -> Optional[PairChunkingProgressEvent]:
+        """
+        Last chunking progress event of this pair (None if the pair has not been chunked yet).
+        Can be passed to :meth:: chunk() of the next pair to continue its progress event group.
+        """
+        return self._progress_event
 
     @property
     def cls(self) -> type:
         return self._cls
 
+    @staticmethod
+    def make_pair_key(names_a: Iterable[str], names_b: Iterable[str]) -> str:
+        """
+        Build a pair key from identifiers (e.g. file names) of the texts of a pair.
+
+        :param names_a: identifiers of the texts to verify
+        :param names_b: identifiers of the texts to compare with
+        :return: pair key
+        """
+        return "\n".join(sorted(names_a)) + "\n\n" + "\n".join(sorted(names_b))
+
     @property
     def pair_id(self) -> Optional[str]:
-        if self._pair_id is None:
-            self._pair_id = str(uuid5(self.SAMPLE_PAIR_NS, "\n".join(sorted(self._a) + sorted(self._b))))
+        if self._pair_id is None and self._pair_key is not None:
+            self._pair_id = self._make_pair_id(self._pair_key)
+        elif self._pair_id is None:
+            # hash texts individually instead of concatenating them
+            digests_a = sorted(hashlib.blake2b(t.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+                               for t in self._a)
+            digests_b = sorted(hashlib.blake2b(t.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+                               for t in self._b)
+            self._pair_id = self._make_pair_id(b"".join(digests_a) + b"\n" + b"".join(digests_b))
 
         return self._pair_id
 
@@ -90,16 +276,143 @@ class SamplePairImpl(SamplePair):
         self._pair_id = pair_id
 
     @property
-    def chunks_a(self) -> List[str]:
+    def chunks_a(self) -> Sequence[Any]:
         return self._chunks_a
 
     @property
-    def chunks_b(self) -> List[str]:
+    def chunks_b(self) -> Sequence[Any]:
         return self._chunks_b
 
     def replace_chunks(self, chunks_a, chunks_b):
-        self._chunks_a = chunks_a
-        self._chunks_b = chunks_b
+        self._chunks_a = ChunkArray.from_chunks(chunks_a)
+        self._chunks_b = ChunkArray.from_chunks(chunks_b)
+
+    def replace_chunks_view(self, text: str, offsets_a: np.ndarray, offsets_b: np.ndarray):
+        self._chunks_a = ChunkArray.from_offsets(text, offsets_a)
+        self._chunks_b = ChunkArray.from_offsets(text, offsets_b)
+
+
+class StreamingSamplePairImpl(SamplePairImpl):
+    """
+    :class:: SamplePairImpl which keeps its chunks in a temporary file instead of in memory
+    while it is waiting to be processed.
+
+    Chunks are written to the file once they have been generated and loaded again on first
+    access. Pickled copies of the pair (e.g. sent to worker processes) only carry the file name.
+    The file is deleted when the original pair is garbage-collected.
+    """
+
+    __slots__ = ("_spill_dir", "_chunks_file", "__weakref__")
+
+    def __init__(self, cls: SamplePairClass, chunker: Chunker, pair_key: Optional[str] = None,
+                 spill_dir: Optional[str] = None):
+        """
+        :param cls: class of the pair
+        :param chunker: chunker for splitting input text
+        :param pair_key: key string identifying the texts of this pair (see :class:: SamplePairImpl)
+        :param spill_dir: directory for the chunk file (None for the default temp directory)
+        """
+        super().__init__(cls, chunker, pair_key)
+        self._spill_dir = spill_dir
+        self._chunks_file = None
+
+    async def chunk(self, a: List[str], b: List[str], executor: Optional[Executor] = None,
+                    progress_event: Optional[PairChunkingProgressEvent] = None):
+        await super().chunk(a, b, executor, progress_event)
+
+        fd, file_name = tempfile.mkstemp(suffix=".chunks", dir=self._spill_dir)
+        weakref.finalize(self, _remove_file, file_name)
+        with open(fd, "wb") as f:
+            pickle.dump((self._chunks_a, self._chunks_b), f, pickle.HIGHEST_PROTOCOL)
+
+        # derive the pair ID (if it isn't known yet) before the input texts are dropped
+        self.pair_id
+        self._chunks_file = file_name
+        self._chunks_a = None
+        self._chunks_b = None
+        self._a = None
+        self._b = None
+
+    def _load_chunks(self):
+        """
+        Load chunks from the chunk file.
+        """
+        with open(self._chunks_file, "rb") as f:
+            self._chunks_a, self._chunks_b = pickle.load(f)
+
+    @property
+    def chunks_a(self) -> Sequence[Any]:
+        if self._chunks_a is None:
+            self._load_chunks()
+        return self._chunks_a
+
+    @property
+    def chunks_b(self) -> Sequence[Any]:
+        if self._chunks_b is None:
+            self._load_chunks()
+        return self._chunks_b
+
+    def replace_chunks(self, chunks_a, chunks_b):
+        super().replace_chunks(chunks_a, chunks_b)
+        self._chunks_file = None
+
+    def replace_chunks_view(self, text: str, offsets_a: np.ndarray, offsets_b: np.ndarray):
+        super().replace_chunks_view(text, offsets_a, offsets_b)
+        self._chunks_file = None
+
+    def __getstate__(self):
+        state = {s: getattr(self, s) for c in type(self).__mro__ for s in getattr(c, "__slots__", ())
+                 if s != "__weakref__" and hasattr(self, s)}
+        if state.get("_chunks_file") is not None:
+            # don't copy loaded chunks, the copy can load them from the file itself
+            state["_chunks_a"] = None
+            state["_chunks_b"] = None
+        return state
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+
+def _remove_file(file_name: str):
+    """
+    Remove a file if it still exists.
+
+    :param file_name: name of the file
+    """
+    try:
+        os.remove(file_name)
+    except FileNotFoundError:
+        pass
+
+
+def _new_pair(parser: CorpusParser, cls: SamplePairClass, pair_key: Optional[str] = None) -> SamplePairImpl:
+    """
+    Create a new (not yet chunked) pair for a parser. The pair keeps its chunks on disk if
+    the parser has a :attr:: CorpusParser.chunk_spill_dir configured.
+
+    :param parser: parser generating the pair
+    :param cls: class of the pair
+    :param pair_key: key string identifying the texts of this pair
+    :return: new pair
+    """
+    if parser.chunk_spill_dir is not None:
+        return StreamingSamplePairImpl(cls, parser.chunk_tokenizer, pair_key, parser.chunk_spill_dir)
+    return SamplePairImpl(cls, parser.chunk_tokenizer, pair_key)
+
+
+def _new_chunking_progress(parser: CorpusParser, total_texts: Optional[int] = None) -> PairChunkingProgressEvent:
+    """
+    Create the initial chunking progress event for a pass of a parser over its corpus.
+    All pairs generated in this pass continue its event group (see :meth:: SamplePairImpl.chunk()),
+    so progress is reported for the whole corpus instead of once for every pair.
+
+    :param parser: parser generating the pairs
+    :param total_texts: total number of texts in all pairs (None or 0 if unknown)
+    :return: initial progress event
+    """
+    group_id = PairChunkingProgressEvent.generate_group_id([type(parser).__name__, str(parser.corpus_path)])
+    return PairChunkingProgressEvent(group_id, 0, total_texts or None)
 
 
 class TextListParser(CorpusParser):
@@ -142,6 +455,7 @@ class TextListParser(CorpusParser):
 
         num_combinations = math.factorial(len(texts)) // 2 // math.factorial(len(texts) - 2)
 
+        progress = _new_chunking_progress(self, 2 * num_combinations)
         for pair_num, (t1, t2) in enumerate(combinations(texts, 2)):
             if t1[0] is None or t2[0] is None:
                 cls = self.Class.UNSPECIFIED
@@ -150,8 +464,9 @@ class TextListParser(CorpusParser):
             else:
                 cls = self.Class.DIFFERENT_AUTHORS
 
-            pair = SamplePairImpl(cls, self.chunk_tokenizer)
-            await pair.chunk([t1[1]], [t2[1]])
+            pair = _new_pair(self, cls, SamplePairImpl.make_pair_key([t1[2]], [t2[2]]))
+            await pair.chunk([t1[1]], [t2[1]], self.chunk_executor, progress)
+            progress = pair.progress_event
 
             group_id = PairBuildingProgressEvent.generate_group_id([t1[2], t2[2]])
             await EventBroadcaster().publish("onPairGenerated",
@@ -209,18 +524,15 @@ class TextPairParser(CorpusParser):
         if not os.path.isdir(self.corpus_path):
             raise IOError("Corpus '{}' not found".format(self.corpus_path))
 
-        dirs = os.listdir(self.corpus_path)
-        for d in dirs:
-            dir_path = os.path.realpath(os.path.join(self.corpus_path, d))
-            if not os.path.isdir(dir_path):
-                continue
-
-            files = sorted(os.listdir(dir_path))
-            for f in files:
-                file_path = os.path.realpath(os.path.join(dir_path, f))
-                if not os.path.isfile(file_path) or not f.endswith(".txt"):
-                    continue
+        # scan author directories concurrently in the default executor
+        dir_entries = self._scan_dir(self.corpus_path, dirs=True)
+        dirs = [e.name for e in dir_entries]
+        loop = asyncio.get_event_loop()
+        scans = await asyncio.gather(*[loop.run_in_executor(None, self._scan_author_dir, e.path)
+                                       for e in dir_entries])
 
+        for d, file_paths in zip(dirs, scans):
+            for file_path in file_paths:
                 self._input_files[file_path] = d
                 if d not in self._input_authors:
                     self._input_authors[d] = []
@@ -228,20 +540,44 @@ class TextPairParser(CorpusParser):
 
         self._is_prepared = True
 
+    @staticmethod
+    def _scan_author_dir(dir_path: str) -> List[str]:
+        """
+        List the resolved paths of all sample files in an author directory.
+
+        :param dir_path: author directory
+        :return: list of sample file paths sorted by file name (empty if ``dir_path`` is not a directory)
+        """
+        dir_path = os.path.realpath(dir_path)
+        if not os.path.isdir(dir_path):
+            return []
+
+        # filter by extension before anything else, so other entries are never stat()ed or sorted
+        with os.scandir(dir_path) as it:
+            entries = sorted((e for e in it if e.name.endswith(".txt")), key=lambda e: e.name)
+
+        file_paths = []
+        for entry in entries:
+            if entry.is_file():
+                # entries of a resolved directory only need resolving if they are links themselves
+                file_paths.append(os.path.realpath(entry.path) if entry.is_symlink() else entry.path)
+        return file_paths
+
     async def __aiter__(self) -> AsyncGenerator[SamplePair, None]:
         await self._prepare()
 
         num_combinations = math.factorial(len(self._input_files)) // 2 // math.factorial(len(self._input_files) - 2)
         pair_num = 0
 
+        progress = _new_chunking_progress(self, 2 * num_combinations)
         for f1, f2 in combinations(self._input_files.keys(), 2):
-            f1_contents = await self.await_file(f1)
-            f2_contents = await self.await_file(f2)
+            contents = await self.await_files((f1, f2))
 
             cls = self.Class.SAME_AUTHOR if self._input_files[f1] == self._input_files[f2] \
                 else self.Class.DIFFERENT_AUTHORS
-            pair = SamplePairImpl(cls, self.chunk_tokenizer)
-            await pair.chunk([f1_contents], [f2_contents])
+            pair = _new_pair(self, cls, SamplePairImpl.make_pair_key([f1], [f2]))
+            await pair.chunk([contents[f1]], [contents[f2]], self.chunk_executor, progress)
+            progress = pair.progress_event
 
             group_id = PairBuildingProgressEvent.generate_group_id(["a:" + f1] + ["b:" + f2])
             await EventBroadcaster().publish("onPairGenerated",
@@ -264,38 +600,146 @@ class AuthorPairParser(TextPairParser):
     async def __aiter__(self) -> AsyncGenerator[SamplePair, None]:
         await self._prepare()
 
-        pair_num = 0
-        single_file_sets = []
+        single_file_sets = set()
 
+        # list the files of all pairs first, so the total number of texts to chunk is known
+        file_pairs = []
         for a1, a2 in combinations_with_replacement(self._input_authors.keys(), 2):
             for f1 in self._input_authors[a1]:
-                f2 = sorted([f for f in self._input_authors[a2] if f != f1])
+                # author file lists are sorted by file name, but symlinks are resolved, so sort by path
+                f2 = sorted(f for f in self._input_authors[a2] if f != f1)
                 if not f2:
                     # skip if author has only one file
                     continue
 
                 if len(f2) == 1:
-                    fs = {f1, f2[0]}
+                    fs = frozenset((f1, f2[0]))
                     if fs in single_file_sets:
                         # We already compared these two texts
                         continue
-                    single_file_sets.append(fs)
+                    single_file_sets.add(fs)
 
-                f1_contents = await self.await_file(f1)
-                f2_contents = [await self.await_file(f) for f in f2]
+                file_pairs.append((self.Class.SAME_AUTHOR if a1 == a2 else self.Class.DIFFERENT_AUTHORS, f1, f2))
 
-                cls = self.Class.SAME_AUTHOR if a1 == a2 else self.Class.DIFFERENT_AUTHORS
-                pair = SamplePairImpl(cls, self.chunk_tokenizer)
-                await pair.chunk([f1_contents], f2_contents)
+        progress = _new_chunking_progress(self, sum(1 + len(f2) for _, _, f2 in file_pairs))
+        for pair_num, (cls, f1, f2) in enumerate(file_pairs):
+            contents = await self.await_files([f1] + f2)
 
-                group_id = PairBuildingProgressEvent.generate_group_id(["a:" + f1] + ["b:" + ",".join(f2)])
-                await EventBroadcaster().publish("onPairGenerated",
-                                               PairBuildingProgressEvent(group_id, pair_num, None,
-                                                                         pair, [f1], f2),
-                                               self.__class__)
+            pair = _new_pair(self, cls, SamplePairImpl.make_pair_key([f1], f2))
+            await pair.chunk([contents[f1]], [contents[f] for f in f2], self.chunk_executor, progress)
+            progress = pair.progress_event
 
-                yield pair
-                pair_num += 1
+            group_id = PairBuildingProgressEvent.generate_group_id(["a:" + f1] + ["b:" + ",".join(f2)])
+            await EventBroadcaster().publish("onPairGenerated",
+                                           PairBuildingProgressEvent(group_id, pair_num, len(file_pairs),
+                                                                     pair, [f1], f2),
+                                           self.__class__)
+
+            yield pair
+
+
+async def _chunk_drawn_pairs(parser: CorpusParser, drawn_pairs: List[Tuple]) -> AsyncGenerator[SamplePair, None]:
+    """
+    Chunk pairs of drawn texts and publish their chunking progress and generation events.
+
+    :param parser: parser generating the pairs
+    :param drawn_pairs: list of tuples of pair class, texts a, texts b, file names a and file names b
+    :return: async generator over the generated pairs
+    """
+    progress = _new_chunking_progress(parser, sum(len(d[1]) + len(d[2]) for d in drawn_pairs))
+    for pair_num, (pair_class, chunks_a, chunks_b, file_names_a, file_names_b) in enumerate(drawn_pairs):
+        pair = _new_pair(parser, pair_class, SamplePairImpl.make_pair_key(file_names_a, file_names_b))
+        await pair.chunk(chunks_a, chunks_b, parser.chunk_executor, progress)
+        progress = pair.progress_event
+        group_id = PairBuildingProgressEvent.generate_group_id([pair.pair_id])
+        await EventBroadcaster().publish("onPairGenerated",
+                                         PairBuildingProgressEvent(group_id, pair_num, len(drawn_pairs),
+                                                                   pair, file_names_a, file_names_b),
+                                         parser.__class__)
+        yield pair
+
+
+async def _prefetch_pairs(pairs: AsyncGenerator[SamplePair, None],
+                          max_pending: int = 8) -> AsyncGenerator[SamplePair, None]:
+    """
+    Drive a pair generator in a background task and yield its pairs from a bounded queue,
+    so that the next pairs are already being built while the consumer processes the current one.
+    Only useful if pairs are chunked in an executor, since the producer task otherwise competes
+    with the consumer for the event loop.
+
+    :param pairs: pair generator
+    :param max_pending: maximum number of built pairs waiting to be consumed
+    :return: async generator over the pairs of ``pairs``
+    """
+    queue = asyncio.Queue(max_pending)
+    done = object()
+
+    async def produce():
+        try:
+            async for pair in pairs:
+                await queue.put((pair, None))
+            await queue.put((done, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put((done, e))
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            pair, error = await queue.get()
+            if pair is done:
+                if error is not None:
+                    raise error
+                break
+            yield pair
+    finally:
+        producer.cancel()
+
+
+def _draw_index_pairs(num_texts1: int, num_texts2: int, same_class: bool, samples: int,
+                      oversample: bool = False) -> List[Tuple[int, int]]:
+    """
+    Randomly draw pairs of text indices from two classes without replacement.
+
+    When drawing from the same class (``num_texts1`` must equal ``num_texts2`` then), both
+    sides of the pairs are disjoint and at most half of the texts are drawn for each side.
+    Otherwise up to ``samples`` pairs are drawn until one class is exhausted. With ``oversample``,
+    an exhausted class is drawn from again while fewer than ``samples // 2`` pairs were drawn.
+
+    :param num_texts1: number of texts in the first class
+    :param num_texts2: number of texts in the second class
+    :param same_class: whether both classes are the same
+    :param samples: maximum number of pairs to draw
+    :param oversample: whether to oversample classes with too few texts
+    :return: list of index pairs
+    """
+    if same_class:
+        num_pairs = min(samples, num_texts1 // 2) if num_texts1 >= 2 else 0
+        drawn = random.sample(range(num_texts1), 2 * num_pairs)
+        return list(zip(drawn[:num_pairs], drawn[num_pairs:]))
+
+    if num_texts1 == 0 or num_texts2 == 0:
+        return []
+
+    pairs = []
+    order_a = random.sample(range(num_texts1), num_texts1)
+    order_b = random.sample(range(num_texts2), num_texts2)
+    pos_a = 0
+    pos_b = 0
+    while len(pairs) < samples and pos_a < num_texts1 and pos_b < num_texts2:
+        pairs.append((order_a[pos_a], order_b[pos_b]))
+        pos_a += 1
+        pos_b += 1
+
+        if oversample and len(pairs) < samples // 2 and pos_a >= num_texts1:
+            order_a = random.sample(range(num_texts1), num_texts1)
+            pos_a = 0
+        elif oversample and len(pairs) < samples // 2 and pos_b >= num_texts2:
+            order_b = random.sample(range(num_texts2), num_texts2)
+            pos_b = 0
+
+    return pairs
 
 
 class WebisBuzzfeedAuthorshipCorpusParser(CorpusParser):
@@ -329,61 +773,60 @@ class WebisBuzzfeedAuthorshipCorpusParser(CorpusParser):
         self._samples = samples
 
     async def __aiter__(self) -> AsyncGenerator[SamplePair, None]:
+        # file paths and texts by portal as parallel lists
+        paths_by_portals = {}
         texts_by_portals = {}
 
         for ds in self._datasets:
             ds_path = os.path.join(self.corpus_path, ds)
-            files = os.listdir(ds_path)
-
-            for f in files:
-                file_path = os.path.join(ds_path, f)
+            for entry in self._scan_dir(ds_path, ".xml"):
+                file_path = entry.path
 
-                if not os.path.isfile(file_path) or not f.endswith(".xml"):
-                    continue
-
-                xml = etree.parse(file_path).getroot()
-                portal = ""
-                main_text = ""
-                done = 0
-                for e in xml:
-                    if e.tag == "uri":
-                        portal = urlparse(str(e.text)).hostname
-                        done += 1
-                    if e.tag == "mainText":
-                        main_text = str(e.text)
-                        done += 1
-                    if done >= 2:
-                        break
-
-                if portal == "" or main_text == "":
+                elements = self._parse_article(file_path, ("uri", "mainText"))
+                if "uri" not in elements or "mainText" not in elements:
                     continue
+                portal = urlparse(str(elements["uri"])).hostname
+                main_text = str(elements["mainText"])
 
                 if portal not in texts_by_portals:
+                    paths_by_portals[portal] = []
                     texts_by_portals[portal] = []
-                texts_by_portals[portal].append((file_path, main_text))
+                paths_by_portals[portal].append(file_path)
+                texts_by_portals[portal].append(main_text)
 
         # discard all portals with too few texts
         discard = []
         for p in texts_by_portals:
             if len(texts_by_portals[p]) < 50:
                 discard.append(p)
-        texts_by_portals = {k: v for (k, v) in texts_by_portals.items() if k not in discard}
+        for p in discard:
+            del paths_by_portals[p]
+            del texts_by_portals[p]
+
+        pairs = self._build_pairs(paths_by_portals, texts_by_portals)
+        if self.chunk_executor is not None:
+            # pairs are chunked in another process, so build the next ones while the current one is consumed
+            pairs = _prefetch_pairs(pairs)
+        async for pair in pairs:
+            yield pair
 
-        pair_num = 0
+    async def _build_pairs(self, paths_by_portals: Dict[str, List[str]],
+                           texts_by_portals: Dict[str, List[str]]) -> AsyncGenerator[SamplePair, None]:
+        """
+        Draw and chunk pairs of texts from all combinations of portals.
 
+        :param paths_by_portals: file paths by portal
+        :param texts_by_portals: main texts by portal (parallel to ``paths_by_portals``)
+        :return: async generator over the generated pairs
+        """
+        # draw the texts of all pairs first, so the total number of texts to chunk is known
+        drawn_pairs = []
         for cls1 in texts_by_portals:
             num_texts1 = len(texts_by_portals[cls1])
 
             for cls2 in texts_by_portals:
                 num_texts2 = len(texts_by_portals[cls2])
 
-                # number of already matched chunk / text pairs
-                pair_counter = 0
-
-                # keep track of already drawn texts
-                drawn_a = []
-                drawn_b = []
-
                 # final chunks of a pair
                 chunks_a = []
                 chunks_b = []
@@ -392,56 +835,47 @@ class WebisBuzzfeedAuthorshipCorpusParser(CorpusParser):
                 file_names_a = []
                 file_names_b = []
 
-                while pair_counter < self._samples and len(drawn_a) < num_texts1 and len(drawn_b) < num_texts2:
-                    idx1 = random.randint(0, num_texts1 - 1)
-                    idx2 = random.randint(0, num_texts2 - 1)
-                    if cls1 == cls2:
-                        # make sure the cut between both sets is always empty
-                        # when comparing a class against itself
-                        if idx1 == idx2:
-                            continue
-                        if idx1 in drawn_a or idx1 in drawn_b:
-                            continue
-                        if idx2 in drawn_a or idx2 in drawn_b:
-                            continue
-
-                    if idx1 in drawn_a or idx2 in drawn_b:
-                        continue
+                for idx1, idx2 in _draw_index_pairs(num_texts1, num_texts2, cls1 == cls2, self._samples, True):
+                    chunks_a.append(texts_by_portals[cls1][idx1])
+                    chunks_b.append(texts_by_portals[cls2][idx2])
+                    file_names_a.append(paths_by_portals[cls1][idx1])
+                    file_names_b.append(paths_by_portals[cls2][idx2])
 
-                    chunks_a.append(texts_by_portals[cls1][idx1][1])
-                    chunks_b.append(texts_by_portals[cls2][idx2][1])
-                    file_names_a.append(texts_by_portals[cls1][idx1][0])
-                    file_names_b.append(texts_by_portals[cls2][idx2][0])
-                    drawn_a.append(idx1)
-                    drawn_b.append(idx2)
+                pair_class = self.Class.DIFFERENT_PORTALS
+                if cls1 == cls2:
+                    pair_class = self.Class.SAME_PORTAL
 
-                    pair_counter += 1
+                drawn_pairs.append((pair_class, chunks_a, chunks_b, file_names_a, file_names_b))
 
-                    # break earlier when we are comparing a class with itself, since
-                    # we only need half the number of iterations
-                    if cls1 == cls2 and len(drawn_a) >= num_texts1 // 2:
-                        break
+        async for pair in _chunk_drawn_pairs(self, drawn_pairs):
+            yield pair
 
-                    # generate more samples by random oversampling when one class has less
-                    # than self._samples // 2 samples
-                    if pair_counter < self._samples // 2 and len(drawn_a) >= num_texts1:
-                        drawn_a = []
-                    elif pair_counter < self._samples // 2 and len(drawn_b) >= num_texts2:
-                        drawn_b = []
+    @staticmethod
+    def _parse_article(file_path: str, tags: Sequence[str]) -> Dict[str, Optional[str]]:
+        """
+        Stream-parse an article XML file and return the texts of the first top-level
+        elements with the given tags. Parsing stops as soon as all tags have been found.
 
-                pair_class = self.Class.DIFFERENT_PORTALS
-                if cls1 == cls2:
-                    pair_class = self.Class.SAME_PORTAL
+        :param file_path: XML file
+        :param tags: tag names of the top-level elements to find
+        :return: dict mapping found tag names to element texts
+        """
+        found = {}
+        depth = 0
+        with open(file_path, "rb") as f:
+            for event, elem in etree.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    continue
 
-                pair = SamplePairImpl(pair_class, self.chunk_tokenizer)
-                await pair.chunk(chunks_a, chunks_b)
-                group_id = PairBuildingProgressEvent.generate_group_id([pair.pair_id])
-                await EventBroadcaster().publish("onPairGenerated",
-                                               PairBuildingProgressEvent(group_id, pair_num, None,
-                                                                         pair, file_names_a, file_names_b),
-                                               self.__class__)
-                pair_num += 1
-                yield pair
+                depth -= 1
+                if depth == 1:
+                    if elem.tag in tags and elem.tag not in found:
+                        found[elem.tag] = elem.text
+                        if len(found) == len(tags):
+                            break
+                    elem.clear()
+        return found
 
 
 class WebisBuzzfeedCatCorpusParser(CorpusParser):
@@ -494,6 +928,10 @@ class WebisBuzzfeedCatCorpusParser(CorpusParser):
         REAL_LEFT = 22
         REAL_RIGHT = 23
 
+    # pair classes by ordered combinations of single text classes (only in the order of the pair class name,
+    # so texts of the first class always end up on side a), filled after the class definition
+    _PAIR_MAP = {}
+
     def __init__(self, corpus_path: str, chunk_tokenizer: Tokenizer, datasets: List[str],
                  class_assigner: Callable[[etree.Element], SingleTextClass], samples: int = 100):
         """
@@ -510,6 +948,25 @@ class WebisBuzzfeedCatCorpusParser(CorpusParser):
         self._class_assigner = class_assigner
         self._samples = samples
 
+    # single text classes by orientation and veracity values
+    _ORIENTATION_CLASSES = {
+        "left": SingleTextClass.LEFT,
+        "right": SingleTextClass.RIGHT,
+        "mainstream": SingleTextClass.MAINSTREAM
+    }
+    _VERACITY_CLASSES = {
+        "satire": SingleTextClass.SATIRE,
+        "mostly false": SingleTextClass.FAKE,
+        "mixture of true and false": SingleTextClass.FAKE,
+        "mostly true": SingleTextClass.REAL
+    }
+    _ORIENTATION_VERACITY_CLASSES = {
+        ("left", SingleTextClass.FAKE): SingleTextClass.FAKE_LEFT,
+        ("right", SingleTextClass.FAKE): SingleTextClass.FAKE_RIGHT,
+        ("left", SingleTextClass.REAL): SingleTextClass.REAL_LEFT,
+        ("right", SingleTextClass.REAL): SingleTextClass.REAL_RIGHT
+    }
+
     @staticmethod
     def class_by_orientation(xmlroot: etree.Element) -> SingleTextClass:
         """
@@ -520,22 +977,10 @@ class WebisBuzzfeedCatCorpusParser(CorpusParser):
         :param xmlroot: XML root of the text
         :return: assigned class
         """
-        cls = None
-
-        for c in xmlroot:
-            if c.tag == "orientation":
-                cls = c.text
-                break
+        ori = (xmlroot.findtext("orientation") or "").strip()
 
-        e = WebisBuzzfeedCatCorpusParser.SingleTextClass
-        if cls == "left":
-            return e.LEFT
-        elif cls == "right":
-            return e.RIGHT
-        elif cls == "mainstream":
-            return e.MAINSTREAM
-
-        return e.UNSPECIFIED
+        e = WebisBuzzfeedCatCorpusParser
+        return e._ORIENTATION_CLASSES.get(ori, e.SingleTextClass.UNSPECIFIED)
 
     @staticmethod
     def class_by_veracity(xmlroot: etree.Element) -> SingleTextClass:
@@ -547,25 +992,12 @@ class WebisBuzzfeedCatCorpusParser(CorpusParser):
         :param xmlroot: XML root of the text
         :return: assigned class
         """
-        cls = None
-
-        for c in xmlroot:
-            if c.tag == "orientation" and c.text == "satire":
-                cls = "satire"
-                break
-            if c.tag == "veracity":
-                cls = c.text
-                # don't break to make sure satire overrides veracity
+        ori = (xmlroot.findtext("orientation") or "").strip()
+        ver = (xmlroot.findtext("veracity") or "").strip()
 
-        e = WebisBuzzfeedCatCorpusParser.SingleTextClass
-        if cls == "satire":
-            return e.SATIRE
-        elif cls == "mostly false" or cls == "mixture of true and false":
-            return e.FAKE
-        elif cls == "mostly true":
-            return e.REAL
-
-        return e.UNSPECIFIED
+        # satire overrides veracity
+        e = WebisBuzzfeedCatCorpusParser
+        return e._VERACITY_CLASSES.get("satire" if ori == "satire" else ver, e.SingleTextClass.UNSPECIFIED)
 
     @staticmethod
     def class_by_orientation_and_veracity(xmlroot: etree.Element) -> SingleTextClass:
@@ -577,87 +1009,76 @@ class WebisBuzzfeedCatCorpusParser(CorpusParser):
         :param xmlroot: XML root of the text
         :return: assigned class
         """
-        ver = None
-        ori = None
-
-        done = 0
-        for c in xmlroot:
-            if c.tag == "veracity":
-                ver = c.text
-                done += 1
-            if c.tag == "orientation":
-                ori = c.text
-                done += 1
-            if done >= 2:
-                break
-
-        fake = (ver == "mostly false" or ver == "mixture of true and false")
-        real = (ver == "mostly true")
+        ori = (xmlroot.findtext("orientation") or "").strip()
+        ver = (xmlroot.findtext("veracity") or "").strip()
 
-        e = WebisBuzzfeedCatCorpusParser.SingleTextClass
-        if fake and ori == "left":
-            return e.FAKE_LEFT
-        elif fake and ori == "right":
-            return e.FAKE_RIGHT
-        elif real and ori == "left":
-            return e.REAL_LEFT
-        elif real and ori == "right":
-            return e.REAL_RIGHT
-
-        return e.UNSPECIFIED
+        e = WebisBuzzfeedCatCorpusParser
+        return e._ORIENTATION_VERACITY_CLASSES.get((ori, e._VERACITY_CLASSES.get(ver)),
+                                                   e.SingleTextClass.UNSPECIFIED)
 
     async def __aiter__(self) -> AsyncGenerator[SamplePair, None]:
+        # file paths and main texts by class as parallel lists
+        paths_by_class = {}
         texts_by_class = {}
         for ds in self._datasets:
             ds_path = os.path.join(self.corpus_path, ds)
-            files = os.listdir(ds_path)
-
-            for f in files:
-                file_path = os.path.join(ds_path, f)
-
-                if not os.path.isfile(file_path) or not f.endswith(".xml"):
-                    continue
+            for entry in self._scan_dir(ds_path, ".xml"):
+                file_path = entry.path
 
                 xml = etree.parse(file_path).getroot()
                 cls = self._class_assigner(xml)
                 if cls == self.SingleTextClass.UNSPECIFIED:
                     continue
 
+                # keep only the main text instead of the whole document tree
+                main_text = xml.find("mainText")
+                if main_text is not None:
+                    main_text = str(main_text.text)
+                del xml
+
                 if cls not in texts_by_class:
+                    paths_by_class[cls] = []
                     texts_by_class[cls] = []
-                texts_by_class[cls].append((file_path, xml))
+                paths_by_class[cls].append(file_path)
+                texts_by_class[cls].append(main_text)
+
+        pairs = self._build_pairs(paths_by_class, texts_by_class)
+        if self.chunk_executor is not None:
+            # pairs are chunked in another process, so build the next ones while the current one is consumed
+            pairs = _prefetch_pairs(pairs)
+        async for pair in pairs:
+            yield pair
 
-        # compound classes to build
-        processed_comp_classes = []
+    async def _build_pairs(self, paths_by_class: Dict[SingleTextClass, List[str]],
+                           texts_by_class: Dict[SingleTextClass, List[Optional[str]]]) \
+            -> AsyncGenerator[SamplePair, None]:
+        """
+        Draw and chunk pairs of texts from all valid combinations of single text classes.
 
-        pair_num = 0
+        :param paths_by_class: file paths by single text class
+        :param texts_by_class: main texts by single text class (parallel to ``paths_by_class``)
+        :return: async generator over the generated pairs
+        """
+        # compound classes to build
+        processed_comp_classes = set()
 
+        # draw the texts of all pairs first, so the total number of texts to chunk is known
+        drawn_pairs = []
         for cls1 in texts_by_class:
             num_texts1 = len(texts_by_class[cls1])
 
             for cls2 in texts_by_class:
-                pair_class = None
-                try:
-                    pair_class = self.PairClass[str(cls1) + "_" + str(cls2)]
-                    pair_class = self.PairClass[str(cls2) + "_" + str(cls1)]
-                except KeyError:
-                    if pair_class is None:
-                        continue
+                pair_class = self._PAIR_MAP.get((cls1, cls2))
+                if pair_class is None:
+                    continue
 
-                comp_class = {cls1, cls2}
+                comp_class = frozenset((cls1, cls2))
                 if comp_class in processed_comp_classes:
                     continue
-                processed_comp_classes.append(comp_class)
+                processed_comp_classes.add(comp_class)
 
                 num_texts2 = len(texts_by_class[cls2])
 
-                # list to keep track of already drawn texts, so we don't use them again
-                drawn_a = []
-                drawn_b = []
-
-                # number of already matched chunk / text pairs
-                pair_counter = 0
-
                 # final chunks of a pair
                 chunks_a = []
                 chunks_b = []
@@ -671,58 +1092,27 @@ class WebisBuzzfeedCatCorpusParser(CorpusParser):
                    cls1 == cls2 and num_texts1 < self._samples // 4:
                     continue
 
-                while pair_counter < self._samples and len(drawn_a) < num_texts1 and len(drawn_b) < num_texts2 > 0:
-                    idx1 = random.randint(0, num_texts1 - 1)
-                    idx2 = random.randint(0, num_texts2 - 1)
-                    if cls1 == cls2:
-                        # make sure the cut between both sets is always empty
-                        # when comparing a class against itself
-                        if idx1 == idx2:
-                            continue
-                        if idx1 in drawn_a or idx1 in drawn_b:
-                            continue
-                        if idx2 in drawn_a or idx2 in drawn_b:
-                            continue
-
-                    if idx1 in drawn_a or idx2 in drawn_b:
-                        continue
+                for idx1, idx2 in _draw_index_pairs(num_texts1, num_texts2, cls1 == cls2, self._samples):
+                    if texts_by_class[cls1][idx1] is not None:
+                        chunks_a.append(texts_by_class[cls1][idx1])
+                        file_names_a.append(paths_by_class[cls1][idx1])
 
-                    for e in texts_by_class[cls1][idx1][1]:
-                        if e.tag == "mainText":
-                            chunks_a.append(str(e.text))
-                            file_names_a.append(texts_by_class[cls1][idx1][0])
-                            break
-                    drawn_a.append(idx1)
-                    for e in texts_by_class[cls2][idx2][1]:
-                        if e.tag == "mainText":
-                            chunks_b.append(str(e.text))
-                            file_names_b.append(texts_by_class[cls2][idx2][0])
-                            break
-                    drawn_b.append(idx2)
+                    if texts_by_class[cls2][idx2] is not None:
+                        chunks_b.append(texts_by_class[cls2][idx2])
+                        file_names_b.append(paths_by_class[cls2][idx2])
 
-                    pair_counter += 1
+                drawn_pairs.append((pair_class, chunks_a, chunks_b, file_names_a, file_names_b))
 
-                    # break earlier when we are comparing a class with itself, since
-                    # we only need half the number of iterations
-                    if cls1 == cls2 and len(drawn_a) >= num_texts1 // 2:
-                        break
+        async for pair in _chunk_drawn_pairs(self, drawn_pairs):
+            yield pair
 
-                    # generate more samples by random oversampling when one class has less
-                    # than self._samples // 2 samples
-                    #if pair_counter < self._samples // 2 and len(drawn_a) >= num_texts1:
-                    #    drawn_a = []
-                    #elif pair_counter < self._samples // 2 and len(drawn_b) >= num_texts2:
-                    #    drawn_b = []
 
-                pair = SamplePairImpl(pair_class, self.chunk_tokenizer)
-                await pair.chunk(chunks_a, chunks_b)
-                group_id = PairBuildingProgressEvent.generate_group_id([pair.pair_id])
-                await EventBroadcaster().publish("onPairGenerated",
-                                               PairBuildingProgressEvent(group_id, pair_num, None,
-                                                                         pair, file_names_a, file_names_b),
-                                               self.__class__)
-                pair_num += 1
-                yield pair
+WebisBuzzfeedCatCorpusParser._PAIR_MAP = {
+    (a, b): WebisBuzzfeedCatCorpusParser.PairClass[a.name + "_" + b.name]
+    for a in WebisBuzzfeedCatCorpusParser.SingleTextClass
+    for b in WebisBuzzfeedCatCorpusParser.SingleTextClass
+    if a.name + "_" + b.name in WebisBuzzfeedCatCorpusParser.PairClass.__members__
+}
 
 
 class PanParser(CorpusParser):
@@ -742,47 +1132,64 @@ class PanParser(CorpusParser):
         # parse ground truth if it exists
         ground_truth = {}
         if os.path.isfile(os.path.join(self.corpus_path, "truth.txt")):
-            with open(os.path.join(self.corpus_path, "truth.txt"), "r", encoding="utf-8", errors="ignore") as f:
+            with open(os.path.join(self.corpus_path, "truth.txt"), "r", encoding="utf-8-sig", errors="ignore") as f:
                 for line in f:
-                    tmp = [x.strip().replace("\ufeff", "") for x in re.split("[ \t]+", line)]
+                    tmp = line.split()
                     if 2 != len(tmp):
                         continue
                     ground_truth[tmp[0]] = (tmp[1].upper() == "Y")
 
-        pair_num = 0
-        total_num_pairs = len(ground_truth)
-
-        for case_dir in tqdm(glob(os.path.join(self.corpus_path, "*")), desc='Text pairs'):
-            if not os.path.isdir(case_dir) or \
-               not os.path.isfile(os.path.join(case_dir, "unknown.txt")) or \
-               not os.path.isfile(os.path.join(case_dir, "known01.txt")):
+        cases = []
+        for case_entry in self._scan_dir(self.corpus_path, dirs=True):
+            file_names = {e.name: e.path for e in self._scan_dir(case_entry.path, ".txt")}
+            if "unknown.txt" not in file_names or "known01.txt" not in file_names:
                 continue
 
-            case = os.path.basename(case_dir)
+            file_name_a = file_names["unknown.txt"]
+            file_names_b = sorted(path for name, path in file_names.items()
+                                  if len(name) == 11 and name.startswith("known"))
+            cases.append((case_entry.name, file_name_a, file_names_b))
 
-            chunks_a = []
-            file_name_a = os.path.join(self.corpus_path, case, "unknown.txt")
-            chunks_a.append(await self.await_file(file_name_a))
+        # read the files of the next few cases in the background while the current pair is being built
+        prefetch = get_cpu_count()
+        reads = [None] * len(cases)
 
-            chunks_b = []
-            file_names_b = sorted(glob(os.path.join(self.corpus_path, case, "known??.txt")))
-            for b in file_names_b:
-                chunks_b.append(await self.await_file(b))
+        def read_ahead(i):
+            if i < len(cases):
+                reads[i] = asyncio.ensure_future(self.await_files([cases[i][1]] + cases[i][2]))
 
-            cls = self.Class.UNSPECIFIED
-            if case in ground_truth:
-                cls = self.Class.SAME_AUTHOR if ground_truth[case] else self.Class.DIFFERENT_AUTHORS
+        for i in range(prefetch):
+            read_ahead(i)
 
-            pair = SamplePairImpl(cls, self.chunk_tokenizer)
-            await pair.chunk(chunks_a, chunks_b)
-            group_id = PairBuildingProgressEvent.generate_group_id([pair.pair_id])
-            await EventBroadcaster().publish("onPairGenerated",
-                                           PairBuildingProgressEvent(group_id, pair_num, total_num_pairs,
-                                                                     pair, [file_name_a], file_names_b),
-                                           self.__class__)
+        progress = _new_chunking_progress(self, sum(1 + len(c[2]) for c in cases))
+        total_num_pairs = len(ground_truth)
 
-            yield pair
-            pair_num += 1
+        try:
+            for pair_num, (case, file_name_a, file_names_b) in enumerate(tqdm(cases, desc='Text pairs')):
+                read_ahead(pair_num + prefetch)
+                contents = await reads[pair_num]
+                reads[pair_num] = None
+                chunks_a = [contents[file_name_a]]
+                chunks_b = [contents[b] for b in file_names_b]
+
+                cls = self.Class.UNSPECIFIED
+                if case in ground_truth:
+                    cls = self.Class.SAME_AUTHOR if ground_truth[case] else self.Class.DIFFERENT_AUTHORS
+
+                pair = _new_pair(self, cls, SamplePairImpl.make_pair_key([file_name_a], file_names_b))
+                await pair.chunk(chunks_a, chunks_b, self.chunk_executor, progress)
+                progress = pair.progress_event
+                group_id = PairBuildingProgressEvent.generate_group_id([pair.pair_id])
+                await EventBroadcaster().publish("onPairGenerated",
+                                               PairBuildingProgressEvent(group_id, pair_num, total_num_pairs,
+                                                                         pair, [file_name_a], file_names_b),
+                                               self.__class__)
+
+                yield pair
+        finally:
+            for read in reads:
+                if read is not None:
+                    read.cancel()
 
 
 class Pan20Parser(PanParser):
@@ -794,7 +1201,7 @@ class Pan20Parser(PanParser):
     """
 
     async def __aiter__(self) -> AsyncGenerator[SamplePair, None]:
-        input_files = glob(os.path.join(self.corpus_path, "*.jsonl"))
+        input_files = [e.path for e in self._scan_dir(self.corpus_path, ".jsonl")]
         if not 1 <= len(input_files) <= 2:
             raise RuntimeError("Corpus must contain one or two .jsonl files, found {}".format(len(input_files)))
 
@@ -809,6 +1216,8 @@ class Pan20Parser(PanParser):
             with open(input_files[1], "r") as truth_file:
                 truths = truth_file.readlines()
 
+        progress = _new_chunking_progress(self, 2 * len(truths) if truths else None)
+
         try:
             truth_it = iter(truths)
             for pair_num, pair_line in enumerate(pair_file):
@@ -825,8 +1234,9 @@ class Pan20Parser(PanParser):
                 if truth_json:
                     cls = self.Class.SAME_AUTHOR if truth_json["same"] else self.Class.DIFFERENT_AUTHORS
 
-                pair = SamplePairImpl(cls, self.chunk_tokenizer)
-                await pair.chunk([pair_json["pair"][0]], [pair_json["pair"][1]])
+                pair = _new_pair(self, cls, pair_json["id"])
+                await pair.chunk([pair_json["pair"][0]], [pair_json["pair"][1]], self.chunk_executor, progress)
+                progress = pair.progress_event
                 await EventBroadcaster().publish(
                     "onPairGenerated", PairBuildingProgressEvent(
                         pair_json["id"], pair_num, len(truths), pair, [pair_json["id"]]), self.__class__)
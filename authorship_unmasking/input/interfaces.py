@@ -13,17 +13,58 @@
 # limitations under the License.
 
 from authorship_unmasking.conf.interfaces import Configurable, path_property
-from authorship_unmasking.util.util import lru_cache, get_base_path
+from authorship_unmasking.event.interfaces import Event
+from authorship_unmasking.util.util import get_base_path, get_cpu_count
 
-from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum, unique
-from typing import Any, AsyncGenerator, Iterable, List
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
+import asyncio
+import codecs
 import os
+import sys
+import numpy as np
 
 
-class Tokenizer(Configurable, metaclass=ABCMeta):
+class _ResultMemo:
+    """
+    LRU cache of tokenization or chunking results of a single tokenizer or chunker configuration.
+    """
+    __slots__ = ("config_version", "entries", "size", "lock")
+
+    def __init__(self, config_version: int):
+        self.config_version = config_version
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = Lock()
+
+    @classmethod
+    def of(cls, owner: Configurable, attr: str) -> "_ResultMemo":
+        """
+        Get the memo stored in attribute ``attr`` of ``owner``, replacing it
+        with an empty one if the configuration of ``owner`` has changed.
+
+        :param owner: tokenizer or chunker owning the memo
+        :param attr: name of the instance attribute holding the memo
+        :return: memo for the current configuration of ``owner``
+        """
+        memo = owner.__dict__.get(attr)
+        if memo is None or memo.config_version != owner._config_version:
+            memo = cls(owner._config_version)
+            setattr(owner, attr, memo)
+        return memo
+
+
+def _text_key(text: str) -> bytes:
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class Tokenizer(Configurable):
     """
     Base class for tokenizers.
 
@@ -31,19 +72,92 @@ class Tokenizer(Configurable, metaclass=ABCMeta):
     can be set at runtime via job configuration.
     """
 
-    @abstractmethod
-    def tokenize(self, text: str) -> Iterable[str]:
+    # maximum number of tokens kept by the tokenization cache of each tokenizer instance
+    MAX_CACHED_TOKENS = 512 * 1024
+
+    def tokenize(self, text: str) -> Tuple[str, ...]:
         """
         Tokenize given input text.
 
         This method will be called a lot and should therefore be as fast as possible.
-        If your tokenizer creates deterministic tokens, you should therefore consider returning
-        cached results by this method into :function:: util.util.lru_cache().
+        Callers should use :meth:: _cached_tokenize() instead, which memoizes the
+        results of this method, so implementations don't need to cache themselves.
 
         :param text: input text
-        :return: Iterable of tokens generated from ``text`` (may be a generator)
+        :return: tuple of tokens generated from ``text``
+        """
+        raise NotImplementedError
+
+    def _cached_tokenize(self, text: str) -> Tuple[str, ...]:
+        """
+        Memoized version of :meth:: tokenize().
+
+        Results are kept in an LRU cache owned by this tokenizer instance, which holds at most
+        :attr:: MAX_CACHED_TOKENS tokens in total. Results with more tokens are not cached at all.
+        The cache is invalidated when a property of this tokenizer is changed.
+
+        :param text: input text
+        :return: tuple of tokens generated from ``text``
+        """
+        memo = _ResultMemo.of(self, "_token_memo")
+        key = _text_key(text)
+        with memo.lock:
+            tokens = memo.entries.get(key)
+            if tokens is not None:
+                memo.entries.move_to_end(key)
+                return tokens
+
+        tokens = tuple(self.tokenize(text))
+        if len(tokens) > self.MAX_CACHED_TOKENS:
+            return tokens
+
+        with memo.lock:
+            if key not in memo.entries:
+                memo.entries[key] = tokens
+                memo.size += len(tokens)
+                while memo.size > self.MAX_CACHED_TOKENS:
+                    memo.size -= len(memo.entries.popitem(last=False)[1])
+        return tokens
+
+    def tokenize_batch(self, texts: Sequence[str]) -> List[Tuple[str, ...]]:
+        """
+        Tokenize a batch of input texts.
+
+        The default implementation tokenizes each text individually using :meth:: _cached_tokenize().
+        Tokenizers with more efficient batch processing may override this method.
+
+        :param texts: input texts
+        :return: list of token tuples, one for each text in ``texts``
+        """
+        return [self._cached_tokenize(text) for text in texts]
+
+    def tokenize_ids(self, text: str, vocabulary: Dict[str, int]) -> np.ndarray:
+        """
+        Tokenize given input text into an array of integer token IDs.
+
+        Tokens which are not in ``vocabulary`` yet are added to it with the next free ID,
+        so IDs are assigned in order of first occurrence and the size of the vocabulary
+        is always ``len(vocabulary)``. Results are not cached.
+
+        :param text: input text
+        :param vocabulary: dict mapping tokens to IDs (will be updated)
+        :return: int32 array of token IDs generated from ``text``
+        """
+        tokens = self.tokenize(text)
+        setdefault = vocabulary.setdefault
+        return np.fromiter((setdefault(t, len(vocabulary)) for t in tokens), dtype=np.int32, count=len(tokens))
+
+    def cache_clear(self):
+        """
+        Clear cached tokenization results of this tokenizer.
         """
-        pass
+        self.__dict__.pop("_token_memo", None)
+
+    def __getstate__(self):
+        # the token cache is process-local and cannot be pickled
+        state = self.__dict__.copy()
+        state.pop("_token_memo", None)
+        return state
 
     async def await_tokens(self, text: str) -> AsyncGenerator[str, None]:
         """
@@ -52,24 +166,31 @@ class Tokenizer(Configurable, metaclass=ABCMeta):
         :param text: input text
         :return: async generator for tokens generated from ``text``
         """
-        for t in self.tokenize(text):
+        for t in self._cached_tokenize(text):
             yield t
 
 
-class Chunker(Configurable, metaclass=ABCMeta):
+class Chunker(Configurable):
     """
     Base class for chunkers.
 
     Tokenizer properties with setters defined via @property.setter
     can be set at runtime via job configuration.
     """
+
+    # whether chunk() always produces the same chunks for the same input text,
+    # only deterministic chunkers have their chunks cached by _cached_chunk()
+    deterministic = True
+
+    # maximum number of texts whose chunks are kept by the chunking cache of each chunker instance
+    MAX_CACHED_CHUNKINGS = 500
+
     def __init__(self, chunk_size: int = 500):
         """
         :param chunk_size: maximum chunk size
         """
         self._chunk_size = chunk_size
 
-    @abstractmethod
     def chunk(self, text: str) -> Iterable[Any]:
         """
         Chunk a given text into several smaller parts.
@@ -77,13 +198,67 @@ class Chunker(Configurable, metaclass=ABCMeta):
         a suitable :class::FeatureSet.
 
         This method will be called a lot and should therefore be as fast as possible.
-        If your chunker creates deterministic tokens, you should therefore consider returning
-        cached results by this method into :function:: util.util.lru_cache().
+        Callers should use :meth:: _cached_chunk() instead, which memoizes the results
+        of this method if the chunker is :attr:: deterministic.
 
         :param text: input text
         :return: Iterable of chunks from ``text`` (may be a generator)
         """
-        pass
+        raise NotImplementedError
+
+    def _cached_chunk(self, text: str) -> Tuple[Any, ...]:
+        """
+        Memoized version of :meth:: chunk() (only for deterministic chunkers).
+
+        Results are kept in an LRU cache owned by this chunker instance, which holds the chunks
+        of at most :attr:: MAX_CACHED_CHUNKINGS texts. The cache is invalidated when a property
+        of this chunker is changed.
+
+        :param text: input text
+        :return: tuple of chunks from ``text``
+        """
+        if not self.deterministic:
+            return tuple(self.chunk(text))
+
+        memo = _ResultMemo.of(self, "_chunk_memo")
+        key = _text_key(text)
+        with memo.lock:
+            chunks = memo.entries.get(key)
+            if chunks is not None:
+                memo.entries.move_to_end(key)
+                return chunks
+
+        chunks = tuple(self.chunk(text))
+        with memo.lock:
+            if key not in memo.entries:
+                memo.entries[key] = chunks
+                while len(memo.entries) > self.MAX_CACHED_CHUNKINGS:
+                    memo.entries.popitem(last=False)
+        return chunks
+
+    def chunk_batch(self, texts: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """
+        Chunk a batch of input texts.
+
+        The default implementation chunks each text individually using :meth:: _cached_chunk().
+        Chunkers with more efficient batch processing may override this method.
+
+        :param texts: input texts
+        :return: list of chunk tuples, one for each text in ``texts``
+        """
+        return [self._cached_chunk(text) for text in texts]
+
+    def cache_clear(self):
+        """
+        Clear cached chunking results of this chunker.
+        """
+        self.__dict__.pop("_chunk_memo", None)
+
+    def __getstate__(self):
+        # the chunk cache is process-local and cannot be pickled
+        state = self.__dict__.copy()
+        state.pop("_chunk_memo", None)
+        return state
 
     async def await_chunks(self, text: str) -> AsyncGenerator[Any, None]:
         """
@@ -92,7 +267,7 @@ class Chunker(Configurable, metaclass=ABCMeta):
         :param text: input text
         :return: async generator for chunks generated from ``text``
         """
-        for t in self.chunk(text):
+        for t in self._cached_chunk(text):
             yield t
 
     @property
@@ -113,6 +288,12 @@ class SamplePairClass(Enum):
     defined in sub-types of this enum type.
     """
 
+    def __init__(self, *args):
+        # pair classes are compared and hashed a lot, so precompute what we need once per member
+        self._hash = hash(self._name_)
+        self._is_unspecified = (self._value_ == -1)
+        self._spellings = frozenset((self._name_, self._name_.lower()))
+
     def __repr__(self):
         return self.name
 
@@ -120,25 +301,65 @@ class SamplePairClass(Enum):
         return self.__repr__()
 
     def __eq__(self, other):
-        if other is None and self.value == -1:
+        if other is self:
             return True
+
+        handler = _PAIR_CLASS_EQ_HANDLERS.get(type(other))
+        if handler is not None:
+            return handler(self, other)
         elif isinstance(other, self.__class__):
-            return other.value == self.value
+            return other._value_ == self._value_
         elif isinstance(other, str):
-            return other.upper() == self.__str__()
+            return _eq_str(self, other)
         elif isinstance(other, int):
-            return other == self.value
-        elif isinstance(other, bool):
-            if self.value == -1:
-                return False
-            else:
-                return bool(self.value) == other
+            return _eq_int(self, other)
 
     def __hash__(self):
-        return self.__repr__().__hash__()
+        return self._hash
+
+    @classmethod
+    def from_any(cls, other) -> "SamplePairClass":
+        """
+        Convert a value to a member of this pair class type.
+        Accepts the same values members compare equal to: members, member names in upper
+        or lower case, member values and None for the ``UNSPECIFIED`` member (value -1).
+
+        :param other: value to convert
+        :return: matching member
+        :raise: ValueError if no member matches ``other``
+        """
+        if isinstance(other, cls):
+            return other
+
+        for member in cls:
+            if member == other:
+                return member
+        raise ValueError("{!r} is not a valid {}".format(other, cls.__name__))
+
+
+def _eq_none(pair_cls: SamplePairClass, other: None) -> bool:
+    return pair_cls._is_unspecified
+
+
+def _eq_str(pair_cls: SamplePairClass, other: str) -> bool:
+    return other in pair_cls._spellings or other.upper() == pair_cls._name_
+
+
+def _eq_int(pair_cls: SamplePairClass, other: int) -> bool:
+    return other == pair_cls._value_
 
 
-class SamplePair(metaclass=ABCMeta):
+# SamplePairClass comparison handlers by exact type of the compared object
+# (bools have always been compared as ints, since bool is a subclass of int)
+_PAIR_CLASS_EQ_HANDLERS = {
+    type(None): _eq_none,
+    str: _eq_str,
+    int: _eq_int,
+    bool: _eq_int
+}
+
+
+class SamplePair:
     """
     Pair of sample text sets.
 
@@ -148,6 +369,8 @@ class SamplePair(metaclass=ABCMeta):
                              fired to indicate pair chunking progress
     """
 
+    __slots__ = ("_cls", "_chunker")
+
     SAMPLE_PAIR_NS = UUID("412bd9f0-4c61-4bb7-a7f2-c88be2f9555c")
 
     def __init__(self, cls: SamplePairClass, chunker: Chunker):
@@ -165,57 +388,99 @@ class SamplePair(metaclass=ABCMeta):
         self._cls = cls
         self._chunker = chunker
 
-    @abstractmethod
-    def chunk(self, a: List[str], b: List[str]):
+    @classmethod
+    def _make_pair_id(cls, key: Union[str, bytes]) -> str:
+        """
+        Derive a pair ID from a key identifying the texts of a pair.
+        The ID is a 128-bit BLAKE2b digest salted with :attr:: SAMPLE_PAIR_NS and formatted
+        as a UUID string.
+
+        :param key: key string or bytes
+        :return: pair ID
+        """
+        if isinstance(key, str):
+            key = key.encode("utf-8", "surrogatepass")
+        digest = blake2b(key, digest_size=16, salt=cls.SAMPLE_PAIR_NS.bytes).digest()
+        return str(UUID(bytes=digest))
+
+    def chunk(self, a: List[str], b: List[str], executor: Optional[Executor] = None,
+              progress_event: Optional[Event] = None):
         """
         Create chunks from inputs.
 
         :param a: input texts one
         :param b: input texts two
+        :param executor: executor to chunk the texts in (None to chunk them in the calling thread)
+        :param progress_event: last progress event of a group shared with previously chunked pairs
+                               (e.g. all pairs of a corpus), which is continued instead of
+                               starting a new progress event group for this pair
         """
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def cls(self) -> SamplePairClass:
         """Class (same author|different authors|unspecified)"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def pair_id(self) -> str:
         """UUID string identifying a pair based on its set of texts."""
-        pass
+        raise NotImplementedError
 
     @pair_id.setter
-    @abstractmethod
     def pair_id(self, pair_id: str):
         """Explicitly set a new pair ID"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def chunks_a(self) -> List[str]:
         """Chunks of first text (text to verify)"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def chunks_b(self) -> List[str]:
         """Chunks of texts to compare the first text (a) with"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def replace_chunks(self, chunks_a, chunks_b):
         """Replace previously set chunks"""
-        pass
+        raise NotImplementedError
+
+    def replace_chunks_view(self, text: str, offsets_a: Sequence[Tuple[int, int]],
+                            offsets_b: Sequence[Tuple[int, int]]):
+        """
+        Replace previously set chunks with slices of a single string.
+        Implementations may store the slices as views instead of individual strings.
+
+        :param text: string to slice chunks from
+        :param offsets_a: ``(start, end)`` offsets of the new chunks of the first text
+        :param offsets_b: ``(start, end)`` offsets of the new chunks of the texts to compare with
+        """
+        self.replace_chunks([text[s:e] for s, e in offsets_a], [text[s:e] for s, e in offsets_b])
 
 
-class CorpusParser(Configurable, metaclass=ABCMeta):
+class CorpusParser(Configurable):
     """
     Base class for corpus parsers.
     """
 
+    # default memory limit of the file cache shared by all parsers
+    MAX_FILE_CACHE_BYTES = 256 * 1024 * 1024
+
+    # executor for chunking the texts of generated pairs (None to chunk them in the event loop),
+    # usually set by the job executor if :attr:: parallel_chunking is enabled
+    chunk_executor = None
+
+    # process-wide file cache and its current memory limit (see :attr:: file_cache_size)
+    _file_cache = OrderedDict()
+    _file_cache_bytes = 0
+    _file_cache_limit = MAX_FILE_CACHE_BYTES
+    _file_cache_lock = Lock()
+
+    # thread pool for reading files shared by all parsers (with the ID of the owning process), created on first use
+    _read_executor = None
+    _read_executor_lock = Lock()
+
     def __init__(self, chunk_tokenizer: Tokenizer, corpus_path: str = None):
         """
         :param corpus_path: path to the corpus directory
@@ -224,6 +489,8 @@ class CorpusParser(Configurable, metaclass=ABCMeta):
         self._corpus_path = None
         self.corpus_path = corpus_path
         self.chunk_tokenizer = chunk_tokenizer
+        self._parallel_chunking = False
+        self._chunk_spill_dir = None
 
     @path_property
     def corpus_path(self) -> str:
@@ -233,34 +500,238 @@ class CorpusParser(Configurable, metaclass=ABCMeta):
     @corpus_path.setter
     def corpus_path(self, path: str):
         """Set corpus path"""
-        self._corpus_path = os.path.join(get_base_path(), path) if path is not None else None
+        if path is None or os.path.isabs(path):
+            self._corpus_path = path
+        else:
+            self._corpus_path = os.path.join(get_base_path(), path)
+
+    @property
+    def file_cache_size(self) -> int:
+        """Get maximum memory size in bytes of the file cache shared by all parsers"""
+        return CorpusParser._file_cache_limit
+
+    @file_cache_size.setter
+    def file_cache_size(self, size: int):
+        """
+        Set maximum memory size in bytes of the file cache shared by all parsers (0 to disable caching).
+        The limit is global: it applies to all parsers in this process and stays in effect
+        until it is set again, also for later job configurations.
+        """
+        with CorpusParser._file_cache_lock:
+            CorpusParser._file_cache_limit = size
+            self._evict_files()
+
+    @property
+    def parallel_chunking(self) -> bool:
+        """Get whether texts of generated pairs are chunked in parallel worker processes"""
+        return self._parallel_chunking
+
+    @parallel_chunking.setter
+    def parallel_chunking(self, parallel: bool):
+        """
+        Set whether texts of generated pairs are chunked in parallel worker processes.
+        This pays off for pairs with many texts on machines with many cores, but
+        tokenization results are not shared between worker processes.
+        """
+        self._parallel_chunking = parallel
+
+    @path_property
+    def chunk_spill_dir(self) -> Optional[str]:
+        """Get directory in which generated pairs keep their chunks until they are used"""
+        return self._chunk_spill_dir
+
+    @chunk_spill_dir.setter
+    def chunk_spill_dir(self, spill_dir: Optional[str]):
+        """
+        Set directory in which generated pairs keep their chunks until they are used
+        instead of keeping them in memory (None to keep chunks in memory).
+        """
+        self._chunk_spill_dir = spill_dir
 
-    @abstractmethod
     async def __aiter__(self) -> AsyncGenerator[SamplePair, None]:
         """
         Asynchronous generator for parsed SamplePairs.
         """
-        pass
+        raise NotImplementedError
+
+    @staticmethod
+    def _scan_dir(dir_path: str, suffix: str = "", dirs: bool = False) -> List[os.DirEntry]:
+        """
+        List the files or sub directories of a corpus directory in directory order.
+
+        Entries are filtered by name before their type is checked, so other
+        entries are never stat()ed. The returned :class:: os.DirEntry objects cache their
+        type and stat() results and should be used instead of re-joining paths.
+
+        :param dir_path: directory to scan
+        :param suffix: only list entries whose name ends with this suffix
+        :param dirs: list sub directories instead of files
+        :return: list of matching directory entries
+        """
+        with os.scandir(dir_path) as it:
+            entries = [e for e in it if e.name.endswith(suffix)]
+        if dirs:
+            return [e for e in entries if e.is_dir()]
+        return [e for e in entries if e.is_file()]
 
     async def await_file(self, file_name) -> str:
         """
         Caching helper coroutine for reading a file.
+        The file is read in the event loop's default executor, so other
+        tasks can continue while waiting for I/O.
 
         :param file_name: name of the file
         :return: its contents
         """
-        return self.read_file(file_name)
+        return await asyncio.get_event_loop().run_in_executor(None, self.read_file, file_name)
+
+    async def await_files(self, file_names: Sequence[str]) -> Dict[str, str]:
+        """
+        Caching helper coroutine for reading multiple files at once.
+        See :meth:: read_files().
+
+        :param file_names: names of the files
+        :return: dict mapping file names to their contents
+        """
+        return await asyncio.get_event_loop().run_in_executor(None, self.read_files, file_names)
 
-    @lru_cache(protected=True, maxsize=50)
     def read_file(self, file_name) -> str:
         """
         Caching helper method for reading a file.
 
+        File contents are cached by all parsers in a shared LRU cache, which is limited
+        to :attr:: file_cache_size bytes in total. Modified files will be read again.
+
+        :param file_name: name of the file
+        :return: its contents
+        """
+        return self.read_files((file_name,))[file_name]
+
+    def read_files(self, file_names: Sequence[str]) -> Dict[str, str]:
+        """
+        Caching helper method for reading multiple files at once.
+
+        The cache is probed for all files first and files which are not
+        cached yet are then read in parallel. See :meth:: read_file().
+
+        :param file_names: names of the files
+        :return: dict mapping file names to their contents
+        """
+        contents = {}
+        misses = []
+
+        stats = [os.stat(f) for f in file_names]
+        with CorpusParser._file_cache_lock:
+            for file_name, stat in zip(file_names, stats):
+                key = (stat.st_dev, stat.st_ino)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                cached = CorpusParser._file_cache.get(key)
+                if cached is not None and cached[0] == signature:
+                    CorpusParser._file_cache.move_to_end(key)
+                    contents[file_name] = cached[1]
+                elif file_name not in contents:
+                    contents[file_name] = None
+                    misses.append((file_name, key, signature))
+
+        if not misses:
+            return contents
+
+        if len(misses) == 1:
+            decoded = [self._decode_file(misses[0][0], misses[0][2][1])]
+        else:
+            decoded = list(self._get_read_executor().map(self._decode_file, [m[0] for m in misses],
+                                                         [m[2][1] for m in misses]))
+
+        with CorpusParser._file_cache_lock:
+            for (file_name, key, signature), file_contents in zip(misses, decoded):
+                contents[file_name] = file_contents
+                self._cache_file(key, signature, file_contents)
+
+        return contents
+
+    @staticmethod
+    def _get_read_executor() -> ThreadPoolExecutor:
+        """
+        Get the thread pool for reading files, which is shared by all parsers, so concurrent
+        reads (e.g. prefetched by several parser tasks) never use more than one thread per CPU.
+
+        :return: shared executor
+        """
+        with CorpusParser._read_executor_lock:
+            # threads of a pool created before a fork don't exist in the child process
+            if CorpusParser._read_executor is None or CorpusParser._read_executor[0] != os.getpid():
+                CorpusParser._read_executor = (os.getpid(), ThreadPoolExecutor(
+                    max_workers=get_cpu_count(), thread_name_prefix="CorpusParser-read"))
+            return CorpusParser._read_executor[1]
+
+    @staticmethod
+    def _decode_file(file_name: str, size: int = -1) -> str:
+        """
+        Read and decode a UTF-8 file, removing all BOMs and normalizing line endings.
+
         :param file_name: name of the file
+        :param size: expected file size in bytes from a previous stat() call (-1 if unknown)
         :return: its contents
         """
-        with open(file_name, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read().replace("\ufeff", "")
+        # read and decode in one go instead of going through the incremental text I/O stack
+        if size < 0:
+            with open(file_name, "rb", buffering=0) as f:
+                raw = f.read()
+        else:
+            # with a known size, read with a single read() call without going through the I/O layer
+            fd = os.open(file_name, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                raw = os.read(fd, size)
+                while len(raw) < size:
+                    part = os.read(fd, size - len(raw))
+                    if not part:
+                        break
+                    raw += part
+            finally:
+                os.close(fd)
+
+        bom_len = len(codecs.BOM_UTF8) if raw.startswith(codecs.BOM_UTF8) else 0
+        contents = str(memoryview(raw)[bom_len:], "utf-8", "ignore")
+        if "\ufeff" in contents:
+            # BOMs of concatenated files may appear anywhere in the text
+            contents = contents.replace("\ufeff", "")
+        if "\r" in contents:
+            contents = contents.replace("\r\n", "\n").replace("\r", "\n")
+        return contents
+
+    @staticmethod
+    def _cache_file(key: Tuple[int, int], signature: Tuple[int, int], contents: str):
+        """
+        Add file contents to the shared file cache and evict least recently used
+        files until the cache fits into :attr:: file_cache_size again.
+        The caller has to hold the cache lock.
+
+        :param key: device and inode number of the file
+        :param signature: modification time and size of the file
+        :param contents: file contents
+        """
+        cache = CorpusParser._file_cache
+        if key in cache:
+            CorpusParser._file_cache_bytes -= cache.pop(key)[2]
+
+        # decoded text takes up to four bytes per character, so charge its actual size
+        num_bytes = sys.getsizeof(contents)
+        if num_bytes > CorpusParser._file_cache_limit:
+            return
+
+        cache[key] = (signature, contents, num_bytes)
+        CorpusParser._file_cache_bytes += num_bytes
+        CorpusParser._evict_files()
+
+    @staticmethod
+    def _evict_files():
+        """
+        Evict least recently used files from the shared file cache until it
+        fits into :attr:: file_cache_size. The caller has to hold the cache lock.
+        """
+        cache = CorpusParser._file_cache
+        while CorpusParser._file_cache_bytes > CorpusParser._file_cache_limit:
+            CorpusParser._file_cache_bytes -= cache.popitem(last=False)[1][2]
 
     async def await_lines(self, file_name) -> AsyncGenerator[str, None]:
         """
@@ -269,11 +740,7 @@ class CorpusParser(Configurable, metaclass=ABCMeta):
         :param file_name: name of the file
         :return: its contents line by line
         """
-        with open(file_name, "r", encoding="utf-8", errors="ignore") as f:
-            first = True
+        # utf-8-sig strips a leading BOM in the decoder, so lines need no further checks
+        with open(file_name, "r", encoding="utf-8-sig", errors="ignore") as f:
             for line in f:
-                if first and line.startswith("\ufeff"):
-                    yield line.replace("\ufeff", "")
-                    first = False
-                else:
-                    yield line
+                yield line
@@ -13,11 +13,10 @@
 # limitations under the License.
 
 from authorship_unmasking.input.interfaces import Tokenizer
-from authorship_unmasking.util.util import lru_cache
 
 import nltk
 
-from typing import Iterable
+from typing import List, Sequence, Tuple
 
 
 class WordTokenizer(Tokenizer):
@@ -25,16 +24,16 @@ class WordTokenizer(Tokenizer):
     Word tokenizer based on NLTK's Treebank Word tokenizer which discards punctuation tokens.
     """
     
-    punctuation = [".", ",", ";", ":", "!", "?", "+", "-", "*", "/", "^", "°", "=", "~", "$", "%",
-                   "(", ")", "[", "]", "{", "}", "<", ">",
-                   "`", "``", "'", "''", "--", "---"]
+    punctuation = frozenset((".", ",", ";", ":", "!", "?", "+", "-", "*", "/", "^", "°", "=", "~", "$", "%",
+                             "(", ")", "[", "]", "{", "}", "<", ">",
+                             "`", "``", "'", "''", "--", "---"))
 
     def __init__(self):
         self._tokenizer = nltk.tokenize.TreebankWordTokenizer()
 
-    @lru_cache(maxsize=700)
-    def tokenize(self, text: str) -> Iterable[str]:
-        return [t for t in self._tokenizer.tokenize(text) if t not in self.punctuation]
+    def tokenize(self, text: str) -> Tuple[str, ...]:
+        punctuation = self.punctuation
+        return tuple([t for t in self._tokenizer.tokenize(text) if t not in punctuation])
 
 
 class CharNgramTokenizer(Tokenizer):
@@ -62,9 +61,9 @@ class CharNgramTokenizer(Tokenizer):
             raise ValueError("Order must be greater than zero")
         self._order = order
     
-    def tokenize(self, text: str) -> Iterable[str]:
-        for i in range(0, len(text) - self._order + 1):
-            yield text[i:i + self._order]
+    def tokenize(self, text: str) -> Tuple[str, ...]:
+        order = self._order
+        return tuple([text[i:i + order] for i in range(0, len(text) - order + 1)])
 
 
 class DisjunctCharNgramTokenizer(CharNgramTokenizer):
@@ -74,13 +73,9 @@ class DisjunctCharNgramTokenizer(CharNgramTokenizer):
     E.g. "hello world" will become ["hel", "lo ", "wor"]
     """
 
-    def tokenize(self, text: str) -> Iterable[str]:
-        text_len = len(text)
-        for i in range(0, text_len, self._order):
-            if i + self._order > text_len:
-                return
-            
-            yield text[i:i + self._order]
+    def tokenize(self, text: str) -> Tuple[str, ...]:
+        order = self._order
+        return tuple([text[i:i + order] for i in range(0, len(text) - order + 1, order)])
 
 
 class PassthroughTokenizer(Tokenizer):
@@ -89,5 +84,9 @@ class PassthroughTokenizer(Tokenizer):
     Useful for chunking larger collections of individual short texts.
     """
     
-    def tokenize(self, text: str) -> Iterable[str]:
-        yield text
+    def tokenize(self, text: str) -> Tuple[str, ...]:
+        return text,
+
+    def tokenize_batch(self, texts: Sequence[str]) -> List[Sequence[str]]:
+        # nothing to tokenize, so don't bother hashing and caching the texts
+        return [(text,) for text in texts]
@@ -21,7 +21,7 @@ from authorship_unmasking.job.interfaces import JobExecutor, ConfigurationExpand
 from authorship_unmasking.input.interfaces import CorpusParser, Chunker
 from authorship_unmasking.meta.interfaces import MetaClassificationModel
 from authorship_unmasking.output.formats import UnmaskingResult, CrossvalResult
-from authorship_unmasking.util.util import clear_lru_caches
+from authorship_unmasking.util.util import clear_lru_caches, get_cpu_count
 
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
@@ -131,25 +131,36 @@ class ExpandingExecutor(JobExecutor):
         strat = self._configure_instance(cfg.get("job.exec.strategy"), Strategy)
         sampler = self._configure_instance(cfg.get("job.classifier.sampler"), ChunkSampler)
 
+        # chunk in a separate pool, so chunking of the next pairs doesn't queue up behind unmasking jobs,
+        # but limit it to half the CPUs, since it runs alongside the unmasking pool
+        chunk_executor = None
+        if parser.parallel_chunking:
+            chunk_executor = parser.chunk_executor = ProcessPoolExecutor(max_workers=max(1, get_cpu_count() // 2))
+
         loop = asyncio.get_event_loop()
-        for _ in range(repetitions):
-            futures = []
+        try:
+            for _ in range(repetitions):
+                futures = []
 
-            async for pair in parser:
-                feature_set = self._configure_instance(
-                    cfg.get("job.classifier.feature_set"), FeatureSet, (pair, sampler))
-                futures.append(loop.run_in_executor(executor, self._exec, strat, feature_set))
-                await asyncio.sleep(0)
+                async for pair in parser:
+                    feature_set = self._configure_instance(
+                        cfg.get("job.classifier.feature_set"), FeatureSet, (pair, sampler))
+                    futures.append(loop.run_in_executor(executor, self._exec, strat, feature_set))
+                    await asyncio.sleep(0)
 
-            await asyncio.wait(futures)
+                await asyncio.wait(futures)
 
-            for output in self.outputs:
-                if config_output_dir:
-                    await output.save(config_output_dir)
-                output.reset()
+                for output in self.outputs:
+                    if config_output_dir:
+                        await output.save(config_output_dir)
+                    output.reset()
 
-            event = ConfigurationFinishedEvent(job_id + "_cfg", config_index, self.aggregators)
-            await EventBroadcaster().publish("onConfigurationFinished", event, self.__class__)
+                event = ConfigurationFinishedEvent(job_id + "_cfg", config_index, self.aggregators)
+                await EventBroadcaster().publish("onConfigurationFinished", event, self.__class__)
+        finally:
+            if chunk_executor is not None:
+                chunk_executor.shutdown()
+                parser.chunk_executor = None
 
         clear_lru_caches()
 
@@ -13,20 +13,75 @@
 # limitations under the License.
 
 from authorship_unmasking.conf.interfaces import ConfigLoader, Configurable
+from authorship_unmasking.conf.loader import SafeLoader
 from authorship_unmasking.event.dispatch import EventBroadcaster
 from authorship_unmasking.event.interfaces import EventHandler
 from authorship_unmasking.features.interfaces import FeatureSet
 from authorship_unmasking.output.interfaces import Output, Aggregator
+from authorship_unmasking.util.util import lru_cache
 
 from abc import abstractmethod, ABCMeta
+from copy import deepcopy
 from importlib import import_module
 from time import time
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 import os
 import yaml
 
 
+@lru_cache(protected=True, maxsize=None)
+def _load_class(name: str) -> type:
+    """
+    Dynamically load a class based on its fully-qualified module path.
+    Classes are looked up only once per name.
+
+    :param name: class name
+    :return: class
+    """
+    modules = name.split(".")
+    mod_path = ".".join(modules[0:-1])
+    mod_name = modules[-1]
+    try:
+        return getattr(import_module(mod_path), mod_name)
+    except ModuleNotFoundError:
+        return getattr(import_module('authorship_unmasking.' + mod_path), mod_name)
+
+
+@lru_cache(protected=True, maxsize=None)
+def _resolve_senders(senders: Tuple[Any, ...]) -> FrozenSet[type]:
+    """
+    Resolve a list of event senders given as class names or classes.
+    Equal sender lists share the same resolved set.
+
+    :param senders: tuple of class names or classes
+    :return: set of sender classes
+    """
+    return frozenset(_load_class(s) if type(s) is str else s for s in senders)
+
+
+# parsed rc files by file name as tuples of modification time and contents
+_rc_file_cache = {}
+
+
+def _load_rc_file(rc_file: str) -> Dict[str, Any]:
+    """
+    Load parameters from a YAML rc file. Files are parsed again only if they were modified.
+
+    :param rc_file: rc file name
+    :return: copy of the parsed parameter dict
+    """
+    mtime = os.stat(rc_file).st_mtime_ns
+    cached = _rc_file_cache.get(rc_file)
+    if cached is None or cached[0] != mtime:
+        with open(rc_file, "r") as f:
+            cached = (mtime, yaml.load(f, Loader=SafeLoader))
+        _rc_file_cache[rc_file] = cached
+
+    # parameters may be modified by the instances they are assigned to
+    return deepcopy(cached[1])
+
+
 class JobExecutor(metaclass=ABCMeta):
     """
     Generic job executor.
@@ -65,10 +120,9 @@ class JobExecutor(metaclass=ABCMeta):
                 output_dir = os.path.join(conf.get_config_path(), output_dir)
 
             output_dir = os.path.relpath(os.path.join(output_dir, job_id))
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-
-            if not os.path.isdir(output_dir):
+            try:
+                os.makedirs(output_dir, exist_ok=True)
+            except FileExistsError:
                 raise IOError("Failed to create output directory '{}', maybe it exists already?".format(output_dir))
 
             conf.save(os.path.join(output_dir, "job"))
@@ -82,13 +136,7 @@ class JobExecutor(metaclass=ABCMeta):
         :param name: class name
         :return: class
         """
-        modules = name.split(".")
-        mod_path = ".".join(modules[0:-1])
-        mod_name = modules[-1]
-        try:
-            return getattr(import_module(mod_path), mod_name)
-        except ModuleNotFoundError:
-            return getattr(import_module('authorship_unmasking.' + mod_path), mod_name)
+        return _load_class(name)
 
     def _configure_instance(self, cfg: Dict[str, Any], assert_type: type = None, ctr_args: Iterable[Any] = None):
         """
@@ -112,8 +160,7 @@ class JobExecutor(metaclass=ABCMeta):
         params = {}
         if "rc_file" in cfg and cfg["rc_file"]:
             rc_file = self._config.resolve_relative_path(cfg["rc_file"])
-            with open(rc_file, "r") as f:
-                params.update(yaml.safe_load(f))
+            params.update(_load_rc_file(rc_file))
 
         if "parameters" in cfg and cfg["parameters"]:
             params.update(cfg["parameters"])
@@ -127,11 +174,11 @@ class JobExecutor(metaclass=ABCMeta):
                 val = self._config.resolve_relative_path(os.path.join('..', val))
             elif obj.is_instance_property(p):
                 is_list = obj.is_instance_list_property(p)
-                if is_list and obj.delegate_args:
+                if is_list and obj.delegates_args(p):
                     val = [self._configure_instance(v, assert_type, ctr_args) for v in val]
                 elif is_list:
                     val = [self._configure_instance(v) for v in val]
-                elif obj.delegate_args:
+                elif obj.delegates_args(p):
                     val = self._configure_instance(val, assert_type, ctr_args)
                 else:
                     val = self._configure_instance(val)
@@ -153,7 +200,7 @@ class JobExecutor(metaclass=ABCMeta):
         for event in events:
             senders = None
             if "senders" in event and type(event["senders"]) is list:
-                senders = {self._load_class(s) if type(s) is str else s for s in event["senders"]}
+                senders = _resolve_senders(tuple(event["senders"]))
             EventBroadcaster().subscribe(event["name"], obj, senders)
 
     def _load_outputs(self, outputs: List[Dict[str, Any]]):
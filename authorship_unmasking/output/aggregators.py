@@ -20,6 +20,8 @@ from authorship_unmasking.output.interfaces import Aggregator, Output
 
 from typing import Dict, Any, List, Tuple, Optional
 
+import numpy as np
+
 
 class CurveAverageAggregator(EventHandler, Aggregator):
     """
@@ -71,7 +73,7 @@ class CurveAverageAggregator(EventHandler, Aggregator):
             # aggregating values across classes is always a mistake
             assert str(cls) == self._curves[agg][0][1]
 
-        self._curves[agg].append((str(identifier), str(cls), values))
+        self._curves[agg].append((str(identifier), str(cls), np.asarray(values, dtype=np.float64)))
 
     def get_aggregated_curves(self) -> Dict[str, Any]:
         avg_curves = {}
@@ -84,12 +86,24 @@ class CurveAverageAggregator(EventHandler, Aggregator):
 
             avg_curves[agg]["files"] = list(self._curve_files.get(agg, []))
             avg_curves[agg]["num_input"] = len(self._curves[agg])
-
-            curves = [x for x in zip(*self._curves[agg])][2]
-            avg_curves[agg]["values"] = [sum(x) / len(x) for x in zip(*curves)]
+            avg_curves[agg]["values"] = self.get_curve_matrix(agg).mean(axis=0).tolist()
 
         return avg_curves
 
+    def get_curve_matrix(self, agg: str) -> np.ndarray:
+        """
+        Get all curves aggregated under a given key packed into one matrix with one row per curve,
+        so they can be processed further with vectorized operations.
+        Curves are truncated to the length of the shortest one.
+
+        :param agg: aggregation key (curve identifier or class name)
+        :return: float64 array of shape (number of curves, number of points)
+        :raise: KeyError if no curves were aggregated under ``agg``
+        """
+        curves = [c[2] for c in self._curves[agg]]
+        min_len = min(len(c) for c in curves)
+        return np.stack([c[:min_len] for c in curves])
+
     def get_aggregated_output(self) -> Output:
         output = UnmaskingResult()
         for m in self._meta_data:
@@ -52,23 +52,35 @@ def clear_lru_caches(clear_protected: bool = False):
     """
     for func in __cached_functions:
         func.cache_clear()
-    __cached_functions.clear()
 
     if clear_protected:
         for func in __protected_cached_functions:
             func.cache_clear()
-        __protected_cached_functions.clear()
 
 
+@lru_cache(protected=True, maxsize=1)
 def get_base_path():
     """
     Get application base path.
+    The path is resolved only once per process.
 
     :return: absolute path to application directory
     """
     return os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
 
 
+def get_cpu_count() -> int:
+    """
+    Get the number of CPUs the current process may run on.
+    On platforms without CPU affinity support, this is the total number of CPUs.
+
+    :return: number of usable CPUs (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 class SoftKeyboardInterrupt(Exception):
     """
     Replacement for KeyboardInterrupt that inherits from :class:: Exception instead of